@@ -8,26 +8,41 @@ Load data from any date/time and view in the same dashboard format as rtviewer
 import os
 import glob
 import argparse
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timedelta
 import numpy as np
 from astropy.io import fits
 from dash import Dash, dcc, html, Input, Output, State
 import plotly.graph_objs as go
+import plotly.io as pio
+from plotly.colors import qualitative
 
 # Add parent paths to import calibration utilities and highz_exp modules
 import sys
 root_dir = Path(__file__).parent.parent.parent  # src/filterbank/visualization -> src
 highz_filterbank_root = root_dir.parent.parent  # src -> Highz-EXP
 sys.path.insert(0, str(root_dir))  # For highz_exp module
-sys.path.insert(0, str(highz_filterbank_root / "highz-filterbank" / "tools" / "rtviewer"))
 sys.path.insert(0, str(highz_filterbank_root / "highz-filterbank" / "tools" / "Plotting"))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # src, for utilities
 
+from utilities.io_utils import FILTER_CENTERS_MHZ, calibration_arrays
+from utilities.io_utils import conversions
+
+# fitsio reads these small, wide binary tables much faster than astropy
+try:
+    import fitsio
+    FITSIO_AVAILABLE = True
+except ImportError:
+    FITSIO_AVAILABLE = False
+
+# orjson encodes the large float arrays in figures much faster than stdlib json
 try:
-    import calibration_utils as cal
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = 'orjson'
+    ORJSON_AVAILABLE = True
 except ImportError:
-    print("Warning: calibration_utils not found, will use fallback calibration")
-    cal = None
+    ORJSON_AVAILABLE = False
 
 # Import filter plotting utilities from local module
 try:
@@ -50,6 +65,18 @@ S21_DIR = "/Users/abdullaalhosani/Projects/highz/highz-filterbank/characterizati
 APPLY_S21_CORRECTIONS = True  # Apply S21 loss correction from S-parameter files
 APPLY_FILTER_NORMALIZATION = True  # Normalize filter responses to align spectra (calculated from measurement data)
 
+# ADC code -> volts mapping of the sweep files (REF = 5.0 V, c_like)
+SWEEP_ADC_MAPPING = dict(ref=5.0, mode="c_like", denom_pos=2**31 - 1, denom_neg=2**31)
+
+# One plot color per filter
+COLORS = np.array((qualitative.Dark24 + qualitative.Light24)[:21])
+
+# Hover template shared by the calibration traces; the trace name identifies the filter
+CALIB_HOVER = ('<b>%{fullData.name}</b><br>'
+               'LO: %{x:.1f} MHz<br>'
+               'Voltage: %{y:.4f} V<br>'
+               '<extra></extra>')
+
 # Initialize Dash app
 app = Dash(__name__)
 app.title = "High-Z Filterbank Historical Viewer"
@@ -118,6 +145,27 @@ app.layout = html.Div([
 ])
 
 
+def sweep_codes(data):
+    """
+    (n_sweeps, 21) int64 ADC codes from a SWEEP_COLUMNS table: the first 7
+    channels of ADC1, ADC2 and ADC3 side by side, read a whole column at a time
+    """
+    if len(data) == 0:
+        return np.zeros((0, 21), dtype=np.int64)
+    columns = []
+    for name in data.dtype.names[:3]:
+        col = np.asarray(data[name])
+        if col.dtype == object:  # variable-length array column
+            col = np.stack([np.asarray(v)[:7] for v in col])
+        columns.append(col[:, :7].astype(np.int64))
+    return np.concatenate(columns, axis=1)
+
+
+def sweep_lo_freqs(data):
+    """LO frequency (MHz) of every sweep in a SWEEP_COLUMNS table, truncated to whole MHz"""
+    return np.trunc(np.asarray(data[data.dtype.names[LO_COL]], dtype=np.float64))
+
+
 def find_available_dates():
     """
     Scan DATA_BASE_DIR for available dates
@@ -160,11 +208,83 @@ def find_files_for_date(date_folder):
     return [os.path.basename(f) for f in fits_files]
 
 
+# Sweep table columns the viewer uses: ADC1, ADC2, ADC3, state, LO frequency
+SWEEP_COLUMNS = (0, 1, 2, 4, 5)
+STATE_COL, LO_COL = 3, 4  # positions within a SWEEP_COLUMNS read
+
+
+def read_bintable(filepath, columns=None):
+    """
+    Read (data, header) of the first binary table HDU, with fitsio when installed
+    columns: optional column positions to read; the result holds only those, in order
+    """
+    if FITSIO_AVAILABLE:
+        with fitsio.FITS(filepath) as fits_file:
+            hdu = fits_file[1]
+            header = hdu.read_header()
+            if columns is None:
+                return hdu.read(), header
+            names = hdu.get_colnames()
+            return hdu.read(columns=[names[i] for i in columns]), header
+    
+    with fits.open(filepath) as hdul:
+        data = hdul[1].data
+        header = hdul[1].header
+        if columns is not None:
+            arrays = [np.asarray(data.field(i)) for i in columns]
+            dtype = [(data.names[i], arr.dtype, arr.shape[1:]) for i, arr in zip(columns, arrays)]
+            data = np.rec.fromarrays(arrays, dtype=dtype)
+        return data, header
+
+
+# Touchstone option line ("# <unit> S <format> R <z0>") frequency multipliers
+S2P_FREQ_SCALE = {'hz': 1.0, 'khz': 1e3, 'mhz': 1e6, 'ghz': 1e9}
+
+
+def read_s2p_s21_db(filename):
+    """
+    Parse S21 in dB from a 2-port Touchstone (v1) file with np.loadtxt
+    Raises ValueError for files the fast parser does not understand
+    """
+    unit, fmt = 'ghz', 'ma'  # Touchstone defaults when no option line is given
+    with open(filename) as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith('#'):
+                for token in line[1:].lower().split():
+                    if token in S2P_FREQ_SCALE:
+                        unit = token
+                    elif token in ('ri', 'ma', 'db'):
+                        fmt = token
+                break
+            if line and not line.startswith('!'):
+                break
+    
+    # 2-port rows: freq S11 S21 S12 S22, each parameter a pair of columns
+    data = np.loadtxt(filename, comments=('!', '#'), usecols=(0, 3, 4), ndmin=2)
+    freqs_mhz = data[:, 0] * (S2P_FREQ_SCALE[unit] / 1e6)
+    
+    if fmt == 'ri':
+        s21_db = 20 * np.log10(np.hypot(data[:, 1], data[:, 2]) + 1e-12)
+    elif fmt == 'ma':
+        s21_db = 20 * np.log10(data[:, 1] + 1e-12)
+    else:
+        s21_db = data[:, 1]
+    
+    return freqs_mhz, s21_db
+
+
 def load_s2p_file(filename):
     """
     Load S2P (Touchstone) file and extract S21 magnitude in dB
-    Uses scikit-rf to properly handle rectangular (real/imaginary) format
+    Parses the table directly with NumPy; falls back to scikit-rf for
+    files the fast parser rejects
     """
+    try:
+        return read_s2p_s21_db(filename)
+    except (ValueError, IndexError, KeyError):
+        pass
+    
     try:
         import skrf as rf
         
@@ -191,27 +311,72 @@ def load_s2p_file(filename):
         return None, None
 
 
+S21_CACHE_NAME = "s21_cache.npz"  # binary copy of the parsed S2P curves, kept in S21_DIR
+
+
+def load_s21_cache(s2p_files):
+    """
+    Load parsed S21 curves from S21_DIR/s21_cache.npz
+    Returns None unless the cache covers exactly these filters and is newer than every S2P file
+    """
+    cache_path = os.path.join(S21_DIR, S21_CACHE_NAME)
+    try:
+        cache_mtime = os.path.getmtime(cache_path)
+        if any(os.path.getmtime(f) >= cache_mtime for f in s2p_files.values()):
+            return None
+        
+        with np.load(cache_path) as cache:
+            if set(cache['sources'].tolist()) != set(s2p_files):
+                return None
+            return {int(filt_num): (cache[f'freqs_{filt_num:02d}'], cache[f's21_{filt_num:02d}'])
+                    for filt_num in cache['filters']}
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def save_s21_cache(s2p_files, curves):
+    """Write parsed S21 curves to S21_DIR/s21_cache.npz (skipped if the directory is read-only)"""
+    arrays = {'sources': np.array(sorted(s2p_files)), 'filters': np.array(sorted(curves))}
+    for filt_num, (freqs, s21_db) in curves.items():
+        arrays[f'freqs_{filt_num:02d}'] = freqs
+        arrays[f's21_{filt_num:02d}'] = s21_db
+    try:
+        np.savez(os.path.join(S21_DIR, S21_CACHE_NAME), **arrays)
+    except OSError as e:
+        print(f"Could not write S21 cache: {e}")
+
+
 def load_s21_corrections():
     """Load S21 correction data for all filters"""
     if not os.path.exists(S21_DIR):
         print(f"S21 directory not found: {S21_DIR}")
         return None
     
-    s21_data = {}
-    
+    s2p_files = {}
     for filt_num in range(21):
         s2p_file = os.path.join(S21_DIR, f"filter_{filt_num:02d}.s2p")
-        
-        if not os.path.exists(s2p_file):
-            continue
-        
-        freqs, s21_db = load_s2p_file(s2p_file)
-        
-        if freqs is not None:
-            s21_data[filt_num] = {
-                'freqs': freqs,
-                's21_db': s21_db
-            }
+        if os.path.exists(s2p_file):
+            s2p_files[filt_num] = s2p_file
+    
+    # Parse the Touchstone files only when the binary cache is missing or stale
+    curves = load_s21_cache(s2p_files)
+    if curves is None:
+        curves = {}
+        for filt_num, s2p_file in s2p_files.items():
+            freqs, s21_db = load_s2p_file(s2p_file)
+            if freqs is not None:
+                curves[filt_num] = (freqs, s21_db)
+        if curves:
+            save_s21_cache(s2p_files, curves)
+    
+    s21_data = {}
+    for filt_num, (freqs, s21_db) in sorted(curves.items()):
+        s21_data[filt_num] = {
+            'freqs': freqs,
+            's21_db': s21_db,
+            # Filter centers are fixed, so interpolate the loss there once
+            'at_center': float(np.interp(FILTER_CENTERS_MHZ[filt_num], freqs, s21_db))
+        }
     
     if len(s21_data) > 0:
         print(f"Loaded S21 corrections for {len(s21_data)}/21 filters")
@@ -333,105 +498,101 @@ def get_per_filter_calibration(data_date=None):
             print("Could not find both -4dBm and +5dBm calibration files")
             return None
         
-        # Power levels (actual measured output from LO)
-        # low_power_dbm = -40.0
-        # high_power_dbm = -31.0
-        # low_power_dbm = -23.0
-        # high_power_dbm = -14.0
-        low_power_dbm = -9.0
-        high_power_dbm = 0.0
+        return _filter_calibration_from_files(
+            low_power_file, os.stat(low_power_file).st_mtime_ns,
+            high_power_file, os.stat(high_power_file).st_mtime_ns,
+            *_s21_signature())
         
-        s21_corrections = load_s21_corrections()
-        filter_centers = [904.0 + i * 2.6 for i in range(21)]
+    except Exception as e:
+        print(f"Error loading per-filter calibration: {e}")
+        return None
+
+
+def _s21_signature():
+    """(S21_DIR, .s2p file count, newest .s2p mtime) - changes whenever the S21 corrections would"""
+    mtimes = [os.stat(f).st_mtime_ns for f in glob.glob(os.path.join(S21_DIR, "*.s2p"))]
+    return S21_DIR, len(mtimes), max(mtimes, default=0)
+
+
+@lru_cache(maxsize=4)
+def _filter_calibration_from_files(low_power_file, low_mtime_ns, high_power_file, high_mtime_ns,
+                                   s21_dir, s21_count, s21_mtime_ns):
+    """
+    Fit the per-filter calibration from a -4dBm/+5dBm file pair
+    Cached on file paths and modification times so dashboard updates reuse one fit;
+    callers must not mutate the returned dict
+    """
+    # Power levels (actual measured output from LO)
+    # low_power_dbm = -40.0
+    # high_power_dbm = -31.0
+    # low_power_dbm = -23.0
+    # high_power_dbm = -14.0
+    low_power_dbm = -9.0
+    high_power_dbm = 0.0
+    
+    s21_corrections = load_s21_corrections()
+    
+    low_data, _ = read_bintable(low_power_file, columns=SWEEP_COLUMNS)
+    high_data, _ = read_bintable(high_power_file, columns=SWEEP_COLUMNS)
+    
+    # LO frequency columns as arrays (truncated to whole MHz like the sweep loop)
+    low_lo = sweep_lo_freqs(low_data)
+    high_lo = sweep_lo_freqs(high_data)
+    
+    # Every sweep converted once; each filter then picks its row
+    low_volts = conversions.adc_counts_to_voltage(sweep_codes(low_data), **SWEEP_ADC_MAPPING)
+    high_volts = conversions.adc_counts_to_voltage(sweep_codes(high_data), **SWEEP_ADC_MAPPING)
+    
+    filter_calibrations = {}
+    
+    for filt_num in range(21):
+        center_freq = float(FILTER_CENTERS_MHZ[filt_num])
         
-        with fits.open(low_power_file) as hdul:
-            low_data = hdul[1].data
+        low_voltage = None
+        high_voltage = None
         
-        with fits.open(high_power_file) as hdul:
-            high_data = hdul[1].data
+        if len(low_lo) > 0:
+            idx = int(np.argmin(np.abs(low_lo - center_freq)))
+            if abs(low_lo[idx] - center_freq) < 1.0:
+                low_voltage = low_volts[idx, filt_num]
         
-        filter_calibrations = {}
+        if len(high_lo) > 0:
+            idx = int(np.argmin(np.abs(high_lo - center_freq)))
+            if abs(high_lo[idx] - center_freq) < 1.0:
+                high_voltage = high_volts[idx, filt_num]
         
-        for filt_num in range(21):
-            center_freq = filter_centers[filt_num]
-            
-            low_voltage = None
-            high_voltage = None
-            
-            best_lo_low = None
-            best_dist_low = float('inf')
-            
-            for row in low_data:
-                lo_freq = int(float(row[5]))
-                dist = abs(lo_freq - center_freq)
-                if dist < best_dist_low:
-                    best_dist_low = dist
-                    best_lo_low = row
-            
-            if best_lo_low is not None and best_dist_low < 1.0:
-                a1 = best_lo_low[0][:7]
-                a2 = best_lo_low[1][:7]
-                a3 = best_lo_low[2][:7]
-                combined_ints = cal.makeSingleListOfInts(a1, a2, a3)
-                volts = cal.toVolts(combined_ints)
-                low_voltage = volts[filt_num]
-            
-            best_lo_high = None
-            best_dist_high = float('inf')
-            
-            for row in high_data:
-                lo_freq = int(float(row[5]))
-                dist = abs(lo_freq - center_freq)
-                if dist < best_dist_high:
-                    best_dist_high = dist
-                    best_lo_high = row
-            
-            if best_lo_high is not None and best_dist_high < 1.0:
-                a1 = best_lo_high[0][:7]
-                a2 = best_lo_high[1][:7]
-                a3 = best_lo_high[2][:7]
-                combined_ints = cal.makeSingleListOfInts(a1, a2, a3)
-                volts = cal.toVolts(combined_ints)
-                high_voltage = volts[filt_num]
-            
-            if low_voltage is None or high_voltage is None:
-                continue
-            
-            s21_loss_db = 0.0
-            
-            if s21_corrections and filt_num in s21_corrections:
-                s21_freqs = s21_corrections[filt_num]['freqs']
-                s21_db = s21_corrections[filt_num]['s21_db']
-                s21_loss_db = np.interp(center_freq, s21_freqs, s21_db)
-            
-            low_power_at_detector = low_power_dbm + s21_loss_db
-            high_power_at_detector = high_power_dbm + s21_loss_db
-            
-            voltage_diff = high_voltage - low_voltage
-            
-            if abs(voltage_diff) < 0.001:
-                continue
-            
-            slope = (high_power_at_detector - low_power_at_detector) / voltage_diff
-            intercept = low_power_at_detector - slope * low_voltage
-            
-            filter_calibrations[filt_num] = {
-                'slope': slope,
-                'intercept': intercept,
-                'low_v': low_voltage,
-                'high_v': high_voltage,
-                'center_freq': center_freq,
-                's21_db': s21_loss_db
-            }
+        if low_voltage is None or high_voltage is None:
+            continue
         
-        if len(filter_calibrations) < 21:
-            print(f"Warning: Only calibrated {len(filter_calibrations)}/21 filters")
+        s21_loss_db = 0.0
         
-        return filter_calibrations if len(filter_calibrations) > 0 else None
+        if s21_corrections and filt_num in s21_corrections:
+            s21_loss_db = s21_corrections[filt_num]['at_center']
         
-    except Exception as e:
-        print(f"Error loading per-filter calibration: {e}")
-        return None
+        low_power_at_detector = low_power_dbm + s21_loss_db
+        high_power_at_detector = high_power_dbm + s21_loss_db
+        
+        voltage_diff = high_voltage - low_voltage
+        
+        if abs(voltage_diff) < 0.001:
+            continue
+        
+        slope = (high_power_at_detector - low_power_at_detector) / voltage_diff
+        intercept = low_power_at_detector - slope * low_voltage
+        
+        filter_calibrations[filt_num] = {
+            'slope': slope,
+            'intercept': intercept,
+            'low_v': low_voltage,
+            'high_v': high_voltage,
+            'center_freq': center_freq,
+            's21_db': s21_loss_db
+        }
+    
+    if len(filter_calibrations) < 21:
+        print(f"Warning: Only calibrated {len(filter_calibrations)}/21 filters")
+    
+    return filter_calibrations if len(filter_calibrations) > 0 else None
 
 
 def load_calibration_data(data_date=None, data_time=None):
@@ -520,58 +681,35 @@ def load_calibration_data(data_date=None, data_time=None):
         
     except Exception as e:
         print(f"Error loading calibration data: {e}")
-        return None, None, None, None
+        return None, None, None, None, None, None
 
 
 def process_spectrum_data(filepath, filter_cal):
     """Process FITS file and return spectrum data and calculated normalization factors"""
     try:
-        hdul = fits.open(filepath)
-        data = hdul[1].data
-        sys_voltage = hdul[1].header.get('SYSVOLT', 0.0)
-        hdul.close()
+        data, header = read_bintable(filepath, columns=SWEEP_COLUMNS)
+        sys_voltage = header.get('SYSVOLT', 0.0)
         
         if len(data) == 0:
             return None, None, None, None, None, None
         
-        first_state = data[0][4]
+        first_state = data[0][STATE_COL]
         
-        all_frequencies = []
-        all_voltages = []
-        all_powers = []
-        all_filters = []
+        # All sweeps as a (n_sweeps, 21) code matrix
+        combined_ints = sweep_codes(data)
+        lo_freqs = sweep_lo_freqs(data)
         
-        for sweep_idx in range(len(data)):
-            a1 = data[sweep_idx][0][:7]
-            a2 = data[sweep_idx][1][:7]
-            a3 = data[sweep_idx][2][:7]
-            lo_freq = int(float(data[sweep_idx][5]))
-            
-            if cal:
-                combined_ints = cal.makeSingleListOfInts(a1, a2, a3)
-                volts_data = cal.toVolts(combined_ints)
-            else:
-                # Fallback: simple conversion if cal not available
-                volts_data = [0.0] * 21
-            
-            db_data = []
-            for filt_num, voltage in enumerate(volts_data):
-                if filter_cal and filt_num in filter_cal:
-                    slope = filter_cal[filt_num]['slope']
-                    intercept = filter_cal[filt_num]['intercept']
-                    power = slope * voltage + intercept
-                else:
-                    power = -43.5 * voltage + 24.98
-                
-                db_data.append(power)
-            
-            frequencies = [2.6 * x + 904 - lo_freq for x in range(21)]
-            filter_channels = list(range(21))
-            
-            all_frequencies.extend(frequencies)
-            all_voltages.extend(volts_data)
-            all_powers.extend(db_data)
-            all_filters.extend(filter_channels)
+        # Decode every sweep once, then calibrate all filters with one multiply-add
+        slopes, intercepts = calibration_arrays(filter_cal, combined_ints.shape[1])
+        volts_matrix = conversions.adc_counts_to_voltage(combined_ints, **SWEEP_ADC_MAPPING)
+        powers_matrix = volts_matrix * slopes + intercepts
+        
+        frequencies_matrix = FILTER_CENTERS_MHZ[None, :volts_matrix.shape[1]] - lo_freqs[:, None]
+        
+        all_frequencies = frequencies_matrix.ravel().tolist()
+        all_voltages = volts_matrix.ravel().tolist()
+        all_powers = powers_matrix.ravel().tolist()
+        all_filters = list(range(volts_matrix.shape[1])) * len(data)
         
         metadata = {
             'voltage': sys_voltage,
@@ -685,46 +823,41 @@ def load_and_display(n_clicks, selected_date, selected_file):
     
     frequencies, voltages, powers, filters, metadata, normalization = result
     
+    # Sweeps come back filter-major within each sweep, so reshape to (n_sweeps, n_filters)
+    # and slice columns per trace instead of regrouping point by point
+    n_filters = max(filters) + 1
+    freq_matrix = np.asarray(frequencies).reshape(-1, n_filters)
+    volt_matrix = np.asarray(voltages).reshape(-1, n_filters)
+    power_matrix = np.asarray(powers).reshape(-1, n_filters)
+    
     # Apply normalization if calculated
     if normalization:
-        normalized_powers = []
-        for power, filt in zip(powers, filters):
-            if filt in normalization:
-                normalized_powers.append(power + normalization[filt])
-            else:
-                normalized_powers.append(power)
-        powers = normalized_powers
-    
-    # Create color palette
-    from plotly.colors import qualitative
-    colors = (qualitative.Dark24[:21] if len(qualitative.Dark24) >= 21 
-              else qualitative.Dark24 + qualitative.Light24[:21-len(qualitative.Dark24)])
+        offsets = np.zeros(n_filters)
+        for filt, offset in normalization.items():
+            offsets[filt] = offset
+        power_matrix = power_matrix + offsets
     
-    # Organize data by filter
-    filter_data = {}
-    for freq, volt, power, filt in zip(frequencies, voltages, powers, filters):
-        if filt not in filter_data:
-            filter_data[filt] = {'freq': [], 'volt': [], 'power': []}
-        filter_data[filt]['freq'].append(freq)
-        filter_data[filt]['volt'].append(volt)
-        filter_data[filt]['power'].append(power)
+    # One WebGL trace per figure: points grouped filter by filter, colored per point
+    plot_filters = np.array([i for i in range(min(21, n_filters)) if i not in [0, 1, 13, 16, 20]])  # Exclude 0, 1, 13, 16, 20
+    n_sweeps = freq_matrix.shape[0]
+    point_filters = np.repeat(plot_filters, n_sweeps)
+    point_colors = np.repeat(COLORS[plot_filters], n_sweeps)
+    plot_freqs = freq_matrix[:, plot_filters].T.ravel()
     
     # Create voltage plot
     voltage_fig = go.Figure()
-    for filt_num in [i for i in range(21) if i not in [0, 1, 13, 16, 20]]:  # Exclude 0, 1, 13, 16, 20
-        if filt_num in filter_data:
-            voltage_fig.add_trace(go.Scatter(
-                x=filter_data[filt_num]['freq'],
-                y=filter_data[filt_num]['volt'],
-                mode='markers',
-                marker=dict(size=3, color=colors[filt_num]),
-                name=f'Filter {filt_num}',
-                showlegend=False,
-                hovertemplate=f'<b>Filter {filt_num}</b><br>' +
-                              '<b>Freq</b>: %{x:.1f} MHz<br>' +
-                              '<b>Voltage</b>: %{y:.4f} V<br>' +
-                              '<extra></extra>'
-            ))
+    voltage_fig.add_trace(go.Scattergl(
+        x=plot_freqs,
+        y=volt_matrix[:, plot_filters].T.ravel(),
+        mode='markers',
+        marker=dict(size=3, color=point_colors),
+        customdata=point_filters,
+        showlegend=False,
+        hovertemplate='<b>Filter %{customdata}</b><br>' +
+                      '<b>Freq</b>: %{x:.1f} MHz<br>' +
+                      '<b>Voltage</b>: %{y:.4f} V<br>' +
+                      '<extra></extra>'
+    ))
     
     voltage_fig.update_layout(
         title=f"Raw Detector Voltages - {data_time_display}",
@@ -741,20 +874,18 @@ def load_and_display(n_clicks, selected_date, selected_file):
     
     # Create power plot
     power_fig = go.Figure()
-    for filt_num in [i for i in range(21) if i not in [0, 1, 13, 16, 20]]:  # Exclude 0, 1, 13, 16, 20
-        if filt_num in filter_data:
-            power_fig.add_trace(go.Scatter(
-                x=filter_data[filt_num]['freq'],
-                y=filter_data[filt_num]['power'],
-                mode='markers',
-                marker=dict(size=3, color=colors[filt_num]),
-                name=f'Filter {filt_num}',
-                showlegend=False,
-                hovertemplate=f'<b>Filter {filt_num}</b><br>' +
-                              '<b>Freq</b>: %{x:.1f} MHz<br>' +
-                              '<b>Power</b>: %{y:.2f} dBm<br>' +
-                              '<extra></extra>'
-            ))
+    power_fig.add_trace(go.Scattergl(
+        x=plot_freqs,
+        y=power_matrix[:, plot_filters].T.ravel(),
+        mode='markers',
+        marker=dict(size=3, color=point_colors),
+        customdata=point_filters,
+        showlegend=False,
+        hovertemplate='<b>Filter %{customdata}</b><br>' +
+                      '<b>Freq</b>: %{x:.1f} MHz<br>' +
+                      '<b>Power</b>: %{y:.2f} dBm<br>' +
+                      '<extra></extra>'
+    ))
     
     power_fig.update_layout(
         title=f"Calibrated Power Spectrum - {data_time_display}",
@@ -818,10 +949,7 @@ def load_and_display(n_clicks, selected_date, selected_file):
                         showlegend=False,
                         line=dict(width=1.5),
                         marker=dict(size=4),
-                        hovertemplate='<b>Filter ' + str(filt_idx) + '</b><br>' +
-                                      'LO: %{x:.1f} MHz<br>' +
-                                      'Voltage: %{y:.4f} V<br>' +
-                                      '<extra></extra>'
+                        hovertemplate=CALIB_HOVER
                     ))
                 
                 calib_pos_fig.update_layout(
@@ -851,10 +979,7 @@ def load_and_display(n_clicks, selected_date, selected_file):
                         showlegend=False,
                         line=dict(width=1.5),
                         marker=dict(size=4),
-                        hovertemplate='<b>Filter ' + str(filt_idx) + '</b><br>' +
-                                      'LO: %{x:.1f} MHz<br>' +
-                                      'Voltage: %{y:.4f} V<br>' +
-                                      '<extra></extra>'
+                        hovertemplate=CALIB_HOVER
                     ))
                 
                 calib_neg_fig.update_layout(
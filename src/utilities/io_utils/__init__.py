@@ -11,6 +11,7 @@ from .fits_loader import (
     load_filtercal,
     load_state_file,
     get_filter_centers,
+    FILTER_CENTERS_MHZ,
     find_closest_lo_row,
     FBFileLoader
 )
@@ -20,12 +21,18 @@ from .calibration import (
     build_filter_calibration,
     build_filter_detector_calibration,
     apply_calibration_to_spectrum,
+    calibration_arrays,
     calculate_filter_normalization
 )
 
 from .conversions import (
     adc_counts_to_voltage,
-    voltage_to_dbm
+    voltage_to_dbm,
+    adc_counts_to_power,
+    MODE_C_LIKE,
+    MODE_SIGNED_BIPOLAR,
+    ASSUME_RMS,
+    ASSUME_PEAK
 )
 
 from .log_detector import (
@@ -47,15 +54,22 @@ __all__ = [
     'load_filtercal',
     'load_state_file',
     'get_filter_centers',
+    'FILTER_CENTERS_MHZ',
     'find_closest_lo_row',
     'FBFileLoader',
     'load_s21_corrections',
     'build_filter_calibration',
     'build_filter_detector_calibration',
     'apply_calibration_to_spectrum',
+    'calibration_arrays',
     'calculate_filter_normalization',
     'adc_counts_to_voltage',
     'voltage_to_dbm',
+    'adc_counts_to_power',
+    'MODE_C_LIKE',
+    'MODE_SIGNED_BIPOLAR',
+    'ASSUME_RMS',
+    'ASSUME_PEAK',
     'LogDetectorCalibration',
     'LOPowerLoader',
     'FilterDetectorCalibration',
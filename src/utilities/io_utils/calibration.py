@@ -8,7 +8,7 @@ import numpy as np
 from pathlib import Path
 import logging
 from .fits_loader import get_filter_centers, find_closest_lo_row
-from .conversions import adc_counts_to_voltage
+from .conversions import adc_counts_to_voltage, adc_counts_to_power
 from .log_detector import FilterDetectorCalibration
 
 logger = logging.getLogger(__name__)
@@ -237,57 +237,63 @@ def apply_calibration_to_spectrum(data_2d, lo_frequencies, filter_calibrations,
     voltages : ndarray (n_freq * 21,), optional
         Voltages if return_voltages=True
     """
-    filter_centers = get_filter_centers()
     n_freq, n_channels = data_2d.shape
+    filter_centers = get_filter_centers(n_channels)
     
-    # Convert all data to voltage
+    # Convert all data to voltage and apply calibration to the whole 2-D block
     # Check if FilterDetectorCalibration object to use its ref_voltage
     if isinstance(filter_calibrations, FilterDetectorCalibration):
         volts_2d = adc_counts_to_voltage(data_2d, ref=filter_calibrations.ref_voltage, mode='c_like')
-        use_detector_cal = True
+        # FilterDetectorCalibration uses 1-indexed filter numbers
+        powers_2d = np.reshape(
+            filter_calibrations.voltage_to_power(volts_2d, filter_nums=np.arange(1, n_channels + 1)),
+            volts_2d.shape,
+        )
     else:
-        volts_2d = adc_counts_to_voltage(data_2d, ref=ref_voltage)
-        use_detector_cal = False
+        slopes, intercepts = calibration_arrays(filter_calibrations, n_channels)
+        powers_2d = adc_counts_to_power(data_2d, slopes, intercepts, ref=ref_voltage)
+        if return_voltages:
+            volts_2d = adc_counts_to_voltage(data_2d, ref=ref_voltage)
     
-    # Initialize output arrays
-    all_frequencies = []
-    all_powers = []
-    all_voltages = []
-    all_filters = []
-    
-    for freq_idx in range(n_freq):
-        lo_freq = lo_frequencies[freq_idx]
-        
-        for filt_num in range(n_channels):
-            # Calculate sky frequency: filter_center - lo_freq
-            sky_freq = filter_centers[filt_num] - lo_freq
-            
-            voltage = volts_2d[freq_idx, filt_num]
-            
-            # Apply calibration
-            if use_detector_cal:
-                # Use FilterDetectorCalibration object (1-indexed filter numbers)
-                power = filter_calibrations.voltage_to_power(voltage, filter_nums=filt_num + 1)
-            elif filt_num in filter_calibrations:
-                # Use dict-based calibration (0-indexed)
-                slope = filter_calibrations[filt_num]['slope']
-                intercept = filter_calibrations[filt_num]['intercept']
-                power = slope * voltage + intercept
-            else:
-                # Fallback: simple estimate if no calibration
-                power = -43.5 * voltage + 24.98
-            
-            all_frequencies.append(sky_freq)
-            all_powers.append(power)
-            all_voltages.append(voltage)
-            all_filters.append(filt_num)
+    # Flatten in (freq, filter) order: sky frequency = filter_center - lo_freq
+    lo_frequencies = np.asarray(lo_frequencies, dtype=float)
+    frequencies = (filter_centers[np.newaxis, :] - lo_frequencies[:, np.newaxis]).ravel()
+    powers = powers_2d.ravel()
+    filters = np.tile(np.arange(n_channels), n_freq)
     
     if return_voltages:
-        return (np.array(all_frequencies), np.array(all_powers), 
-                np.array(all_filters), np.array(all_voltages))
+        return frequencies, powers, filters, volts_2d.ravel()
     else:
-        return (np.array(all_frequencies), np.array(all_powers), 
-                np.array(all_filters))
+        return frequencies, powers, filters
+
+
+def calibration_arrays(filter_calibrations, n_channels=21,
+                       fallback_slope=-43.5, fallback_intercept=24.98):
+    """
+    Build per-channel slope and intercept arrays from a dict calibration.
+    
+    Parameters
+    ----------
+    filter_calibrations : dict or None
+        Per-filter calibration from build_filter_calibration(), keyed by
+        0-indexed filter number with 'slope' and 'intercept' entries
+    n_channels : int
+        Number of filter channels (default: 21)
+    fallback_slope, fallback_intercept : float
+        Linear fit ``power = slope * voltage + intercept`` used for channels
+        missing from ``filter_calibrations`` (default: -43.5 dBm/V, 24.98 dBm)
+    
+    Returns
+    -------
+    slopes, intercepts : ndarray (n_channels,)
+    """
+    slopes = np.full(n_channels, fallback_slope, dtype=float)
+    intercepts = np.full(n_channels, fallback_intercept, dtype=float)
+    for filt_num, cal_info in (filter_calibrations or {}).items():
+        if 0 <= filt_num < n_channels:
+            slopes[filt_num] = cal_info['slope']
+            intercepts[filt_num] = cal_info['intercept']
+    return slopes, intercepts
 
 
 def calculate_filter_normalization(frequencies, powers, filters, 
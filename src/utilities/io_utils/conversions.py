@@ -7,9 +7,62 @@ Absorbed from highz_exp.filter_plotting module.
 
 import numpy as np
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Integer flags accepted in place of the string options below; strings are
+# normalized to these once at function entry
+MODE_C_LIKE = 0
+MODE_SIGNED_BIPOLAR = 1
+ASSUME_RMS = 0
+ASSUME_PEAK = 1
+
+_MODE_FLAGS = {"c_like": MODE_C_LIKE, "signed_bipolar": MODE_SIGNED_BIPOLAR}
+
+
+def _int_flag(value, flags):
+    """Return ``value`` if it is one of the integer ``flags`` (bools excluded), else None."""
+    if isinstance(value, (bool, np.bool_)) or not isinstance(value, (int, np.integer)):
+        return None
+    return int(value) if value in flags else None
+
+
+def _mode_flag(mode):
+    """Normalize an ADC mapping mode (string or MODE_* flag) to its flag."""
+    flag = _int_flag(mode, (MODE_C_LIKE, MODE_SIGNED_BIPOLAR))
+    if flag is not None:
+        return flag
+    try:
+        return _MODE_FLAGS[mode]
+    except (KeyError, TypeError):
+        raise ValueError("mode must be 'c_like', 'signed_bipolar', MODE_C_LIKE "
+                         "or MODE_SIGNED_BIPOLAR.") from None
+
+
+def _assume_flag(assume):
+    """Normalize a voltage convention (string or ASSUME_* flag) to its flag."""
+    flag = _int_flag(assume, (ASSUME_RMS, ASSUME_PEAK))
+    if flag is not None:
+        return flag
+    if not isinstance(assume, str):
+        raise ValueError("assume must be 'rms', 'peak', ASSUME_RMS or ASSUME_PEAK.")
+    return ASSUME_RMS if assume.lower() == "rms" else ASSUME_PEAK
+
+
+def _uint32_codes(c):
+    """Reinterpret raw ADC counts as uint32 codes (MSB = bit 31)."""
+    if c.dtype.kind in "iu":
+        return c.astype(np.uint32, copy=False)
+    # Float-stored codes may exceed the int32 range, wrap via int64
+    return c.astype(np.int64).astype(np.uint32)
+
 
 def adc_counts_to_voltage(counts, ref=3.27, mode="c_like",
-                          denom_pos=2147483647.8, denom_neg=2147483648.0):
+                          denom_pos=2147483647.8, denom_neg=2147483648.0,
+                          dtype=np.float64):
     """
     Convert ADS1263 ADC counts to Volts.
     
@@ -19,44 +72,48 @@ def adc_counts_to_voltage(counts, ref=3.27, mode="c_like",
         Raw ADC codes (often stored as floats in files)
     ref : float
         Reference voltage (Volts). Default 3.27 V, use 5.0 for calibration data
-    mode : {"c_like", "signed_bipolar"}
+    mode : {"c_like", "signed_bipolar"} or {MODE_C_LIKE, MODE_SIGNED_BIPOLAR}
         - "c_like": replicate C-style mapping, resulting in ~0..ref V
         - "signed_bipolar": interpret as true signed int32 (±ref full-scale)
     denom_pos, denom_neg : float
         Denominators used in C-like mapping (kept tunable)
+    dtype : numpy dtype
+        Floating dtype of the result. Use np.float32 for plot-only paths to
+        halve memory traffic (worst-case error ~1e-6 V at 5 V full scale);
+        keep float64 when fitting calibrations.
     
     Returns
     -------
     V : ndarray
         Volt values (same shape as counts)
     """
+    mode = _mode_flag(mode)
     c = np.asarray(counts)
+    ftype = np.dtype(dtype).type
 
-    if mode == "c_like":
-        # Work with float arrays; derive sign from MSB as if counts were uint32
-        cu = c.astype(np.uint64)
-        neg = ((cu >> 31) & 0x1) == 1  # MSB set
+    if mode == MODE_C_LIKE:
+        # Treat counts as uint32 codes; the MSB is then the int32 sign bit
+        cu32 = _uint32_codes(c)
+        neg = cu32.view(np.int32) < 0  # MSB set
+        codes = cu32.astype(ftype)
 
-        V = np.empty_like(c, dtype=float)
-        # Negative branch (MSB=1)
-        V[neg] = ref * 2.0 - (cu[neg].astype(float) / denom_neg) * ref
-        # Positive branch (MSB=0)
-        V[~neg] = (cu[~neg].astype(float) / denom_pos) * ref
+        # Branchless: evaluate both mappings over the whole array and
+        # select per element, instead of fancy-indexed scatter writes
+        V = np.where(neg,
+                     ftype(ref * 2.0) - codes * ftype(ref / denom_neg),  # MSB=1
+                     codes * ftype(ref / denom_pos))                     # MSB=0
         return V
 
-    elif mode == "signed_bipolar":
-        # Interpret as true signed int32 counts (two's complement)
+    else:
+        # MODE_SIGNED_BIPOLAR: interpret as true signed int32 counts (two's complement)
         cs = c.astype(np.int64)  # safe up-cast
         cs = ((cs + (1 << 31)) % (1 << 32)) - (1 << 31)
         # Map ±(2^31-1) -> ±ref
         V = (cs / float((1 << 31) - 1)) * ref
-        return V
-
-    else:
-        raise ValueError("mode must be 'c_like' or 'signed_bipolar'.")
+        return V.astype(ftype, copy=False)
 
 
-def voltage_to_dbm(V, R=50.0, assume="rms"):
+def voltage_to_dbm(V, R=50.0, assume="rms", dtype=np.float64):
     """
     Convert Volts to power in dBm for a resistive load.
     
@@ -66,18 +123,96 @@ def voltage_to_dbm(V, R=50.0, assume="rms"):
         Volt values
     R : float
         Load resistance in ohms (default: 50 Ω)
-    assume : {"rms", "peak"}
+    assume : {"rms", "peak"} or {ASSUME_RMS, ASSUME_PEAK}
         If "peak", convert peak to Vrms first
+    dtype : numpy dtype
+        Floating dtype used for the computation and the result
     
     Returns
     -------
     dBm : ndarray
         Power in dBm (non-positive values map to -inf)
     """
-    V = np.asarray(V, dtype=float)
-    Vrms = V if assume.lower() == "rms" else (V / np.sqrt(2.0))
-    P_w = (Vrms ** 2) / R
+    V = np.asarray(V, dtype=dtype)
+    # Vrms = Vpeak/sqrt(2), so fold the peak conversion into the load term
+    denom = R if _assume_flag(assume) == ASSUME_RMS else 2.0 * R
+    P_w = (V * V) / denom
     with np.errstate(divide="ignore", invalid="ignore"):
         dbm = 10.0 * np.log10(P_w / 1e-3)
     dbm[~np.isfinite(dbm)] = -np.inf
     return dbm
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _c_like_counts_to_power_kernel(codes, slopes, intercepts, ref, denom_pos, denom_neg):
+        """Fused c_like counts -> volts -> linear calibration over (n_rows, n_filters)."""
+        n_rows, n_filters = codes.shape
+        scale_pos = ref / denom_pos
+        scale_neg = ref / denom_neg
+        out = np.empty((n_rows, n_filters))
+        for i in prange(n_rows):
+            for j in range(n_filters):
+                code = codes[i, j]
+                if code >= 2147483648:  # MSB set
+                    volts = ref * 2.0 - code * scale_neg
+                else:
+                    volts = code * scale_pos
+                out[i, j] = slopes[j] * volts + intercepts[j]
+        return out
+
+
+def adc_counts_to_power(counts, slopes, intercepts, ref=3.27,
+                        denom_pos=2147483647.8, denom_neg=2147483648.0, axis=-1):
+    """
+    Convert ADS1263 ADC counts straight to calibrated power (dBm).
+    
+    Applies the c_like voltage mapping of ``adc_counts_to_voltage`` followed by
+    the per-filter linear calibration ``power = slope * V + intercept`` along
+    the filter axis. When numba is installed this runs as a single compiled
+    pass with no intermediate voltage array; otherwise it falls back to the
+    equivalent NumPy expression.
+    
+    Parameters
+    ----------
+    counts : array-like
+        Raw ADC codes (often stored as floats in files)
+    slopes, intercepts : array-like (n_filters,)
+        Per-filter calibration in dBm/V and dBm
+    ref : float
+        Reference voltage (Volts). Default 3.27 V
+    denom_pos, denom_neg : float
+        Denominators used in C-like mapping (kept tunable)
+    axis : int
+        Axis of ``counts`` that indexes the filters (default: last)
+    
+    Returns
+    -------
+    powers : ndarray
+        Calibrated power in dBm (same shape as counts)
+    """
+    c = np.asarray(counts)
+    slopes = np.asarray(slopes, dtype=float)
+    intercepts = np.asarray(intercepts, dtype=float)
+    
+    if c.ndim == 0:
+        # A single code has no filter axis to move or loop over
+        volts = adc_counts_to_voltage(c, ref=ref, mode=MODE_C_LIKE,
+                                      denom_pos=denom_pos, denom_neg=denom_neg)
+        return slopes * volts + intercepts
+    
+    c = np.moveaxis(c, axis, -1)
+    if NUMBA_AVAILABLE and c.size > 0:
+        n_filters = c.shape[-1]
+        codes = np.ascontiguousarray(_uint32_codes(c)).reshape(-1, n_filters)
+        powers = _c_like_counts_to_power_kernel(
+            codes,
+            np.ascontiguousarray(np.broadcast_to(slopes, (n_filters,))),
+            np.ascontiguousarray(np.broadcast_to(intercepts, (n_filters,))),
+            float(ref), float(denom_pos), float(denom_neg),
+        ).reshape(c.shape)
+    else:
+        volts = adc_counts_to_voltage(c, ref=ref, mode=MODE_C_LIKE,
+                                      denom_pos=denom_pos, denom_neg=denom_neg)
+        powers = slopes * volts + intercepts
+    return np.moveaxis(powers, -1, axis)
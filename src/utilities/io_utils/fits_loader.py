@@ -13,6 +13,8 @@ import os
 import time
 import logging
 import json
+import zoneinfo
+from datetime import datetime
 from tqdm import tqdm
 from utilities import io_utils
 
@@ -23,9 +25,26 @@ from .VARS import *
 
 logger = logging.getLogger(__name__)
 
-# Cache key: (cycle_dir, apply_s21) -> prepared calibration payload or None
+# Instrument timestamp format and timezone, resolved once at import
+_TIMESTAMP_FORMAT = '%m%d%Y_%H%M%S'
+_UTC = zoneinfo.ZoneInfo('UTC')
+
+# Cache key: (cycle_dir, apply_s21) -> (filtercal file signature, prepared calibration payload or None)
 _calibration_cache = {}
 
+# Cache key: (state file path, spectrum_index) -> ((mtime_ns, size), spectrum dict)
+_state_file_cache = {}
+_STATE_FILE_CACHE_SIZE = 64
+
+def _filtercal_signature(pos_file, neg_file):
+    """Return (mtime_ns, size) of both filtercal files, or None if either is missing."""
+    try:
+        pos_stat = os.stat(pos_file)
+        neg_stat = os.stat(neg_file)
+    except OSError:
+        return None
+    return (pos_stat.st_mtime_ns, pos_stat.st_size, neg_stat.st_mtime_ns, neg_stat.st_size)
+
 def load_calibration_data(cycle_dir, s21_dir=DEFAULT_S21_DIR, apply_s21=True):
     """Load and cache calibration artifacts for one acquisition cycle.
 
@@ -50,28 +69,29 @@ def load_calibration_data(cycle_dir, s21_dir=DEFAULT_S21_DIR, apply_s21=True):
 
     Notes
     -----
-    Cache size is capped to 3 entries to bound memory usage.
+    Cache entries are validated against the modification time and size of
+    both filtercal files, so a cycle whose filtercal files appear or are
+    rewritten after the first call is loaded again. Cache size is capped to
+    3 entries to bound memory usage.
     """
     global _calibration_cache
     
     # Create cache key
     cache_key = (cycle_dir, apply_s21)
     
-    # Check cache first
-    if cache_key in _calibration_cache:
-        return _calibration_cache[cache_key]
-    
-    # Check that required filtercal files exist
     filtercal_pos_file = os.path.join(cycle_dir, "filtercal_+5dBm.fits")
     filtercal_neg_file = os.path.join(cycle_dir, "filtercal_-4dBm.fits")
+    signature = _filtercal_signature(filtercal_pos_file, filtercal_neg_file)
     
-    if not os.path.exists(filtercal_pos_file) or not os.path.exists(filtercal_neg_file):
-        # Cache None result too to avoid repeated checks
-        _calibration_cache[cache_key] = None
-        return None
+    # Check cache first
+    cached = _calibration_cache.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
     
-    if os.path.getsize(filtercal_pos_file) == 0 or os.path.getsize(filtercal_neg_file) == 0:
-        _calibration_cache[cache_key] = None
+    # Check that required filtercal files exist and are non-empty
+    if signature is None or signature[1] == 0 or signature[3] == 0:
+        # Cache None result too to avoid repeated checks
+        _calibration_cache[cache_key] = (signature, None)
         return None
     
     try:
@@ -99,7 +119,7 @@ def load_calibration_data(cycle_dir, s21_dir=DEFAULT_S21_DIR, apply_s21=True):
         }
         
         # Cache the result
-        _calibration_cache[cache_key] = result
+        _calibration_cache[cache_key] = (signature, result)
         logger.debug("Calibration cached for %s", os.path.basename(cycle_dir))
         
         # Keep cache size reasonable (max 3 cycles)
@@ -112,7 +132,7 @@ def load_calibration_data(cycle_dir, s21_dir=DEFAULT_S21_DIR, apply_s21=True):
         
     except Exception:
         logger.exception("Error loading calibration")
-        _calibration_cache[cache_key] = None
+        _calibration_cache[cache_key] = (signature, None)
         return None
 
 def load_prepared_spectrum_data(
@@ -259,6 +279,10 @@ def get_filter_centers(num_filters=21, start_mhz=904.0, step_mhz=2.6):
     return start_mhz + step_mhz * np.arange(num_filters)
 
 
+# Nominal filter bank centers (MHz): 904 + 2.6*n for filters 0-20
+FILTER_CENTERS_MHZ = get_filter_centers()
+
+
 def load_filtercal(filepath):
     """Load a filtercal FITS file using the DATA_CUBE layout.
 
@@ -352,7 +376,32 @@ def load_state_file(filepath, spectrum_index=0):
     ValueError
         If ``spectrum_index`` is outside available rows, or if flattened
         ``DATA_CUBE`` length does not match ``n_lo_pts * n_filters``.
+
+    Notes
+    -----
+    Results are cached per ``(filepath, spectrum_index)`` and reused while the
+    file's modification time and size are unchanged, so repeated refreshes of
+    the same spectrum skip the FITS read. Arrays in the returned dict are
+    shared with the cache and must not be modified in place.
     """
+    cache_key = (os.fspath(filepath), spectrum_index)
+    stat = os.stat(filepath)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _state_file_cache.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return dict(cached[1])
+
+    spectrum = _read_state_file(filepath, spectrum_index)
+
+    if len(_state_file_cache) >= _STATE_FILE_CACHE_SIZE:
+        _state_file_cache.pop(next(iter(_state_file_cache)))
+    _state_file_cache[cache_key] = (signature, spectrum)
+    return dict(spectrum)
+
+
+def _read_state_file(filepath, spectrum_index):
+    """Read one spectrum from a state FITS file (uncached ``load_state_file``)."""
     with fits.open(filepath) as hdul:
         # Primary HDU has metadata
         primary_hdr = hdul[0].header
@@ -376,8 +425,9 @@ def load_state_file(filepath, spectrum_index=0):
         # Load data for requested spectrum
         row = table[spectrum_index]
         
-        lo_frequencies = row['LO_FREQUENCIES']  # (n_freq,) array
-        data_cube_flat = row['DATA_CUBE']  # Flat 1D array
+        # Copy out of the memory-mapped table so cached results don't pin the file
+        lo_frequencies = np.array(row['LO_FREQUENCIES'])  # (n_freq,) array
+        data_cube_flat = np.array(row['DATA_CUBE'])  # Flat 1D array
         spectrum_timestamp = row['SPECTRUM_TIMESTAMP']
         
         expected_size = n_lo_pts * n_filters
@@ -474,11 +524,13 @@ class FBFileLoader:
         >>> get_sorted_cycle_dirs("/data/03012026")
         ['/data/03012026/Cycle_03012026_230', '/data/03012026/Cycle_03012026_231', ...]
         """
-        import glob
-        
-        all_items = glob.glob(os.path.join(day_dir, "*"))
-        cycle_dirs = [d for d in all_items if os.path.isdir(d) and 'Cycle_' in os.path.basename(d)]
-        cycle_dirs.sort()
+        # One directory pass; DirEntry.is_dir() avoids a stat per entry
+        try:
+            with os.scandir(day_dir) as entries:
+                cycle_dirs = sorted(entry.path for entry in entries
+                                    if 'Cycle_' in entry.name and entry.is_dir())
+        except OSError:
+            cycle_dirs = []
         
         logger.info("Found %d cycle directories in %s", len(cycle_dirs), day_dir)
         if len(cycle_dirs) == 0:
@@ -510,23 +562,71 @@ class FBFileLoader:
         The instrument C code sometimes appends ".fits" to timestamps, which is
         stripped before parsing.
         """
-        from datetime import datetime
-        import zoneinfo
-        
         # Strip .fits extension if present (from instrument C code)
         if timestamp_str.endswith('.fits'):
             timestamp_str = timestamp_str[:-5]
         
         # Parse MMDDYYYY_HHMMSS format
         try:
-            dt = datetime.strptime(timestamp_str, '%m%d%Y_%H%M%S')
+            dt = datetime.strptime(timestamp_str, _TIMESTAMP_FORMAT)
             # Add UTC timezone
-            utc_tz = zoneinfo.ZoneInfo('UTC')
-            return dt.replace(tzinfo=utc_tz)
+            return dt.replace(tzinfo=_UTC)
         except ValueError:
             logger.exception("Failed to parse timestamp: %s", timestamp_str)
             return None
     
+    @staticmethod
+    def _parse_timestamps(timestamp_strs, day_str):
+        """Parse a column of MMDDYYYY_HHMMSS timestamps in one pass.
+        
+        Splits the date and time fields of all timestamps with vectorized
+        string/integer operations instead of calling ``strptime`` per row.
+        Entries that are not in the fixed-width format fall back to
+        ``_parse_timestamp``.
+        
+        Parameters
+        ----------
+        timestamp_strs : array-like of str
+            SPECTRUM_TIMESTAMP column values (optionally ending in ".fits").
+        day_str : str
+            Day string in format "MMDDYYYY", forwarded to ``_parse_timestamp``.
+            
+        Returns
+        -------
+        list
+            Parsed UTC datetime objects, with None for unparseable entries.
+        """
+        ts = np.char.strip(np.asarray(timestamp_strs).astype(str))
+        if ts.size == 0:
+            return []
+        
+        parts = np.char.partition(ts, '_')
+        date_part = parts[:, 0]
+        time_part = np.char.partition(parts[:, 2], '.')[:, 0]  # drop ".fits"
+        well_formed = (
+            (np.char.str_len(date_part) == 8) & np.char.isdigit(date_part)
+            & (np.char.str_len(time_part) == 6) & np.char.isdigit(time_part)
+        )
+        
+        dates = np.where(well_formed, date_part, '0').astype(np.int64)
+        times = np.where(well_formed, time_part, '0').astype(np.int64)
+        fields = zip(
+            well_formed.tolist(),
+            (dates % 10000).tolist(), (dates // 1000000).tolist(), (dates // 10000 % 100).tolist(),
+            (times // 10000).tolist(), (times // 100 % 100).tolist(), (times % 100).tolist(),
+        )
+        
+        parsed = []
+        for i, (ok, year, month, day, hour, minute, second) in enumerate(fields):
+            if ok:
+                try:
+                    parsed.append(datetime(year, month, day, hour, minute, second, tzinfo=_UTC))
+                    continue
+                except ValueError:
+                    pass
+            parsed.append(FBFileLoader._parse_timestamp(str(ts[i]), day_str))
+        return parsed
+    
     @staticmethod
     def _merge_filters_to_spectrum(frequencies, powers, filter_indices):
         """Merge 21 filter channels into single spectrum, taking minimum at overlaps.
@@ -555,23 +655,19 @@ class FBFileLoader:
         -----
         The output arrays are sorted by frequency in ascending order.
         """
-        # Group powers by frequency (handle floating point comparison with rounding)
-        freq_power_map = {}
+        # Group powers by frequency (handle floating point comparison with rounding
+        # to the nearest 0.001 MHz), sorted so equal frequencies are adjacent
+        freq_keys = np.round(np.asarray(frequencies, dtype=np.float64), 3)
+        order = np.argsort(freq_keys, kind='stable')
+        sorted_keys = freq_keys[order]
+        sorted_powers = np.asarray(powers, dtype=np.float64)[order]
         
-        for freq, power in zip(frequencies, powers):
-            # Round frequency to avoid floating point issues (nearest 0.001 MHz)
-            freq_key = round(freq, 3)
-            
-            if freq_key in freq_power_map:
-                # Take minimum where frequencies overlap
-                freq_power_map[freq_key] = min(freq_power_map[freq_key], power)
-            else:
-                freq_power_map[freq_key] = power
+        # First index of each run of equal frequencies
+        starts = np.flatnonzero(np.diff(sorted_keys, prepend=np.nan) != 0)
         
-        # Convert to sorted arrays
-        sorted_freqs = sorted(freq_power_map.keys())
-        merged_frequencies = np.array(sorted_freqs)
-        merged_powers = np.array([freq_power_map[f] for f in sorted_freqs])
+        # Take minimum where frequencies overlap (NaN powers are ignored)
+        merged_frequencies = sorted_keys[starts]
+        merged_powers = np.fmin.reduceat(sorted_powers, starts)
         
         logger.debug(
             "Merged %d points from 21 filters into %d unique frequency points",
@@ -709,28 +805,35 @@ class FBFileLoader:
 
                     logger.debug("Cycle %s: processing %d spectra", cycle_name, n_spectra)
 
-                    for spec_idx in range(n_spectra):
-                        try:
-                            row = table[spec_idx]
+                    if n_spectra == 0:
+                        continue
 
-                            lo_frequencies = row['LO_FREQUENCIES']
-                            data_cube_flat = row['DATA_CUBE']
-                            spectrum_timestamp = row['SPECTRUM_TIMESTAMP']
+                    # Array columns are fixed-width, so each one is already a
+                    # contiguous (n_rows, width) block; take it once per file.
+                    expected_size = n_lo_pts * n_filters
+                    data_cubes = np.asarray(table['DATA_CUBE'][:n_spectra])
+                    data_cubes = data_cubes.reshape(n_spectra, -1)
+                    if data_cubes.shape[1] != expected_size:
+                        logger.warning(
+                            "DATA_CUBE size mismatch in %s: got %d, expected %d",
+                            state_file,
+                            data_cubes.shape[1],
+                            expected_size,
+                        )
+                        continue
+                    data_cubes = data_cubes.reshape(n_spectra, n_lo_pts, n_filters)
+                    lo_frequencies_all = np.asarray(table['LO_FREQUENCIES'][:n_spectra])
 
-                            expected_size = n_lo_pts * n_filters
-                            if len(data_cube_flat) != expected_size:
-                                logger.warning(
-                                    "DATA_CUBE size mismatch in %s spectrum %d: got %d, expected %d",
-                                    state_file,
-                                    spec_idx,
-                                    len(data_cube_flat),
-                                    expected_size,
-                                )
-                                continue
+                    spectrum_timestamps = self._parse_timestamps(
+                        table['SPECTRUM_TIMESTAMP'][:n_spectra], day_name
+                    )
 
-                            spectrum_data_2d = data_cube_flat.reshape(n_lo_pts, n_filters)
+                    for spec_idx in range(n_spectra):
+                        try:
+                            lo_frequencies = lo_frequencies_all[spec_idx]
+                            spectrum_data_2d = data_cubes[spec_idx]
 
-                            timestamp = self._parse_timestamp(spectrum_timestamp, day_name)
+                            timestamp = spectrum_timestamps[spec_idx]
                             if timestamp is None:
                                 logger.warning(
                                     "Invalid timestamp in %s spectrum %d, skipping",
@@ -774,8 +877,8 @@ class FBFileLoader:
                                 reference_frequencies = merged_freq
                                 logger.info(
                                     "Reference frequency range: %.2f - %.2f MHz (%d points)",
-                                    merged_freq.min(),
-                                    merged_freq.max(),
+                                    merged_freq[0],
+                                    merged_freq[-1],
                                     len(merged_freq),
                                 )
 
@@ -828,13 +931,13 @@ class FBFileLoader:
         logger.info(
             "Loaded %d spectra. Frequency range: %.2f - %.2f MHz",
             len(timestamps),
-            reference_frequencies.min(),
-            reference_frequencies.max()
+            reference_frequencies[0],
+            reference_frequencies[-1]
         )
         logger.info(
             "Time range: %s to %s",
-            timestamps.min(),
-            timestamps.max()
+            timestamps[0],
+            timestamps[-1]
         )
         logger.info(
             "Output shape: timestamps=%s, frequencies=%s, powers=%s",
@@ -976,11 +1079,13 @@ class FBFileLoader:
             cycle_ids = data["cycle_ids"]
 
         if parse_timestamps:
-            from datetime import datetime
-
+            # Decode the whole column at once rather than per element
+            if timestamps.dtype.kind == "S":
+                ts_strs = np.char.decode(timestamps, "utf-8").tolist()
+            else:
+                ts_strs = timestamps.astype(str).tolist()
             parsed = []
-            for ts in timestamps:
-                ts_str = ts.decode("utf-8") if isinstance(ts, bytes) else str(ts)
+            for ts_str in ts_strs:
                 try:
                     parsed.append(datetime.fromisoformat(ts_str))
                 except ValueError:
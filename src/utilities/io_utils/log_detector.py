@@ -218,6 +218,9 @@ class LOPowerLoader:
         Path to filtercal_+5dBm.fits or filtercal_-4dBm.fits file
     calibration : LogDetectorCalibration, optional
         Log detector calibration object. If None, creates default.
+    table : FITS_rec, optional
+        Binary table (``hdul[1].data``) of ``fits_file`` when the caller
+        already has it open. If None, the file is opened here.
     
     Attributes
     ----------
@@ -231,7 +234,7 @@ class LOPowerLoader:
         Power uncertainties in dB (1-sigma from calibration)
     """
     
-    def __init__(self, fits_file, calibration=None):
+    def __init__(self, fits_file, calibration=None, table=None):
         self.fits_file = Path(fits_file)
         
         if calibration is None:
@@ -239,26 +242,30 @@ class LOPowerLoader:
         else:
             self.calibration = calibration
         
-        self._load_data()
+        self._load_data(table)
     
-    def _load_data(self):
-        """Load log detector data from FITS file."""
-        with fits.open(self.fits_file) as hdul:
-            # Get data table
-            data = hdul[1].data
-            
-            # Extract log detector ADC values (shape is (1, N))
-            log_detector_adc = data['LOG_DETECTOR'][0]
-            
-            # Get frequencies from data table
-            self.frequencies = data['LO_FREQUENCIES'][0]
-            
-            # Convert ADC → voltage → power
-            self.voltages = self.calibration.adc_to_voltage(log_detector_adc)
-            self.powers, self.is_interpolated = self.calibration.voltage_to_power(self.voltages)
-            
-            # Estimate power uncertainties from calibration
-            self.power_uncertainties = self.calibration.estimate_power_uncertainty(self.voltages)
+    def _load_data(self, table=None):
+        """Load log detector data from FITS file, or from an already open table."""
+        if table is None:
+            with fits.open(self.fits_file) as hdul:
+                self._load_table(hdul[1].data)
+        else:
+            self._load_table(table)
+    
+    def _load_table(self, data):
+        """Convert the log detector columns of a filtercal data table."""
+        # Extract log detector ADC values (shape is (1, N))
+        log_detector_adc = data['LOG_DETECTOR'][0]
+        
+        # Get frequencies from data table
+        self.frequencies = data['LO_FREQUENCIES'][0]
+        
+        # Convert ADC → voltage → power
+        self.voltages = self.calibration.adc_to_voltage(log_detector_adc)
+        self.powers, self.is_interpolated = self.calibration.voltage_to_power(self.voltages)
+        
+        # Estimate power uncertainties from calibration
+        self.power_uncertainties = self.calibration.estimate_power_uncertainty(self.voltages)
     
     def get_power_at_frequency(self, freq):
         """
@@ -437,15 +444,9 @@ class FilterDetectorCalibration:
         if not fits_high.exists():
             raise FileNotFoundError(f"High power calibration not found: {fits_high}")
         
-        # Load LO power measurements using LOPowerLoader
-        lo_loader_low = LOPowerLoader(fits_low, self.lo_calibration)
-        lo_loader_high = LOPowerLoader(fits_high, self.lo_calibration)
-        
-        # Store frequencies (should be same for both)
-        self.frequencies = lo_loader_low.frequencies
-        
-        # Load filter ADC data and reference voltage
+        # Load LO power measurements and filter ADC data, opening each file once
         with fits.open(fits_low) as hdul:
+            lo_loader_low = LOPowerLoader(fits_low, self.lo_calibration, table=hdul[1].data)
             data_cube_low = hdul[1].data['DATA_CUBE'].flatten()
             n_lo_pts = hdul[0].header['N_LO_PTS']
             n_filters = hdul[0].header['N_FILTERS']
@@ -454,9 +455,13 @@ class FilterDetectorCalibration:
             self.ref_voltage = float(hdul[1].data['ADC_REFVOLT'][0])
         
         with fits.open(fits_high) as hdul:
+            lo_loader_high = LOPowerLoader(fits_high, self.lo_calibration, table=hdul[1].data)
             data_cube_high = hdul[1].data['DATA_CUBE'].flatten()
             filter_adc_high = data_cube_high.reshape(n_lo_pts, n_filters)
         
+        # Store frequencies (should be same for both)
+        self.frequencies = lo_loader_low.frequencies
+        
         self.n_filters = n_filters
         
         # Convert ADC to voltage for filters using same method as viewer
@@ -39,8 +39,8 @@ def create_filtercal_line_plots(filtercal_pos, filtercal_neg,
         (fig_pos, fig_neg) - two plotly Figure objects
     """
     # Convert ADC counts to voltage (ref=5.0 for filtercal)
-    volts_pos = adc_counts_to_voltage(filtercal_pos['data'], ref=5.0)
-    volts_neg = adc_counts_to_voltage(filtercal_neg['data'], ref=5.0)
+    volts_pos = adc_counts_to_voltage(filtercal_pos['data'], ref=5.0, dtype=np.float32)
+    volts_neg = adc_counts_to_voltage(filtercal_neg['data'], ref=5.0, dtype=np.float32)
     
     lo_pos = filtercal_pos['lo_frequencies']
     lo_neg = filtercal_neg['lo_frequencies']
@@ -148,8 +148,8 @@ def create_filtercal_heatmaps(filtercal_pos, filtercal_neg,
         (fig_pos, fig_neg) - two plotly Figure objects with heatmaps
     """
     # Convert ADC counts to voltage (ref=5.0 for filtercal)
-    volts_pos = adc_counts_to_voltage(filtercal_pos['data'], ref=5.0)
-    volts_neg = adc_counts_to_voltage(filtercal_neg['data'], ref=5.0)
+    volts_pos = adc_counts_to_voltage(filtercal_pos['data'], ref=5.0, dtype=np.float32)
+    volts_neg = adc_counts_to_voltage(filtercal_neg['data'], ref=5.0, dtype=np.float32)
     
     lo_pos = filtercal_pos['lo_frequencies']
     lo_neg = filtercal_neg['lo_frequencies']
@@ -8,6 +8,10 @@ import numpy as np
 import plotly.graph_objs as go
 from plotly.colors import qualitative
 
+# Hover templates shared by every filter trace; the trace name identifies the filter
+VOLTAGE_HOVER = '%{fullData.name}: %{y:.3f}V @ %{x:.0f}MHz<extra></extra>'
+POWER_HOVER = '%{fullData.name}: %{y:.1f}dBm @ %{x:.0f}MHz<extra></extra>'
+
 
 def get_filter_colors(n_filters=21):
     """
@@ -107,7 +111,7 @@ def create_voltage_plot(frequencies, voltages, filter_indices,
             marker=dict(size=3, color=colors[filt_num]),
             name=f'Filter {display_num}',
             showlegend=False,
-            hovertemplate=f'F{display_num}: %{{y:.3f}}V @ %{{x:.0f}}MHz<extra></extra>' if not fast_mode else None,
+            hovertemplate=VOLTAGE_HOVER if not fast_mode else None,
             hoverinfo='skip' if fast_mode else None
         ))
     
@@ -175,7 +179,7 @@ def create_power_plot(frequencies, powers, filter_indices,
             marker=dict(size=3, color=colors[filt_num]),
             name=f'Filter {display_num}',
             showlegend=False,
-            hovertemplate=f'F{display_num}: %{{y:.1f}}dBm @ %{{x:.0f}}MHz<extra></extra>' if not fast_mode else None,
+            hovertemplate=POWER_HOVER if not fast_mode else None,
             hoverinfo='skip' if fast_mode else None
         ))
     
@@ -7,11 +7,119 @@ JSON serialization overhead on Raspberry Pi.
 
 import io
 import base64
+import threading
+from functools import lru_cache
 import numpy as np
 import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend
+# Let Agg drop sub-pixel path vertices and render long paths in chunks
+matplotlib.rcParams.update({
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+})
 import matplotlib.pyplot as plt
 from matplotlib.colors import to_rgb
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+# Figures are shared between requests, so rendering is serialized
+_render_lock = threading.Lock()
+
+
+# Static axes decorations per plot kind, applied once when the figure is
+# created rather than on every refresh
+_AXES_STYLE = {
+    'voltage': {'xlabel': "Frequency (MHz)", 'ylabel': "Voltage (V)",
+                'xlim': (0, 350), 'ylim': (0.8, 2.2)},
+    'power': {'xlabel': "Frequency (MHz)", 'ylabel': "Power (dBm)",
+              'xlim': (-50, 350), 'ylim': (-80, 20)},
+    'filtercal': {'xlabel': "LO Frequency (MHz)", 'ylabel': "Voltage (V)",
+                  'xlim': (900, 960), 'ylim': (0.8, 2.2)},
+}
+
+
+@lru_cache(maxsize=None)
+def _get_figure(kind):
+    """
+    Return the persistent (fig, ax) pair for one plot kind.
+    
+    Figures are created once and reused on every refresh instead of being
+    built and torn down per call. They are plain Agg figures, not registered
+    with pyplot, so they are never closed behind our back. Labels, limits
+    and grid from ``_AXES_STYLE`` and the title font are set here once;
+    callers only update the data artists and the title text.
+    """
+    fig = Figure(figsize=(8, 5), dpi=100, layout='tight')
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    
+    style = _AXES_STYLE[kind]
+    ax.set_xlabel(style['xlabel'], fontsize=10)
+    ax.set_ylabel(style['ylabel'], fontsize=10)
+    ax.set_xlim(*style['xlim'])
+    ax.set_ylim(*style['ylim'])
+    ax.grid(True, alpha=0.3)
+    ax.set_title('', fontsize=11)  # styled once; refreshes only set its text
+    return fig, ax
+
+
+@lru_cache(maxsize=None)
+def _get_filtercal_lines():
+    """
+    Return the persistent LineCollection on the filtercal axes.
+    
+    One collection holds every filter's curve; refreshes replace its
+    segments instead of clearing the axes and adding a new collection.
+    """
+    _, ax = _get_figure('filtercal')
+    lines = LineCollection([], colors=_filter_colors_rgb(), linewidths=1,
+                           alpha=0.8, zorder=2)
+    ax.add_collection(lines, autolim=False)
+    return lines
+
+
+@lru_cache(maxsize=None)
+def _get_filter_points(kind):
+    """
+    Return the persistent marker collection on the ``kind`` axes.
+    
+    All filters share one PathCollection, created empty once; refreshes
+    swap its offsets and per-point colors instead of adding an artist per
+    filter.
+    """
+    _, ax = _get_figure(kind)
+    return ax.scatter(np.empty(0), np.empty(0), s=9, marker='o',
+                      linewidths=0, alpha=0.7)
+
+
+def _set_filter_points(kind, frequencies, values, filter_indices, excluded_filters):
+    """
+    Load one spectrum into the ``kind`` marker collection.
+    
+    Points are ordered by filter so higher filters draw on top, as with
+    one artist per filter; excluded and out-of-range filters are dropped.
+    """
+    filters = np.asarray(filter_indices).astype(int)
+    keep = (filters >= 0) & (filters < 21) & ~np.isin(filters, excluded_filters)
+    order = np.argsort(filters[keep], kind='stable')
+    
+    points = _get_filter_points(kind)
+    points.set_offsets(np.column_stack((np.asarray(frequencies, dtype=float)[keep][order],
+                                        np.asarray(values, dtype=float)[keep][order])))
+    points.set_facecolor(_filter_colors_rgb()[filters[keep][order]])
+
+
+def _figure_to_base64(fig):
+    """Render a figure to a base64-encoded PNG string."""
+    buf = io.BytesIO()
+    try:
+        fig.savefig(buf, format='png', dpi=100, bbox_inches='tight')
+        buf.seek(0)
+        return base64.b64encode(buf.read()).decode('utf-8')
+    finally:
+        buf.close()
 
 
 def get_filter_colors_mpl(n_filters=21):
@@ -23,6 +131,18 @@ def get_filter_colors_mpl(n_filters=21):
     return colors[:n_filters]
 
 
+@lru_cache(maxsize=None)
+def _filter_colors_rgb(n_filters=21):
+    """
+    Filter palette as a shared, read-only (n_filters, 3) RGB array.
+    
+    Built once per size so the persistent artists can index it directly.
+    """
+    colors = np.array(get_filter_colors_mpl(n_filters))
+    colors.flags.writeable = False
+    return colors
+
+
 def create_voltage_plot_static(frequencies, voltages, filter_indices, 
                                excluded_filters=None, title_suffix=""):
     """
@@ -33,51 +153,16 @@ def create_voltage_plot_static(frequencies, voltages, filter_indices,
     if excluded_filters is None:
         excluded_filters = []
     
-    colors = get_filter_colors_mpl()
-    
-    # Organize data by filter
-    filter_data = {}
-    for freq, volt, filt in zip(frequencies, voltages, filter_indices):
-        if filt in excluded_filters:
-            continue
-        filt_num = int(filt) + 1  # 1-indexed
-        if filt_num not in filter_data:
-            filter_data[filt_num] = {'freq': [], 'values': []}
-        filter_data[filt_num]['freq'].append(freq)
-        filter_data[filt_num]['values'].append(volt)
-    
-    # Create plot
-    fig, ax = plt.subplots(figsize=(8, 5), dpi=100)
-    
-    for filt_num in range(1, 22):
-        if filt_num not in filter_data:
-            continue
-        ax.plot(filter_data[filt_num]['freq'], 
-                filter_data[filt_num]['values'],
-                'o', markersize=2, color=colors[filt_num-1], 
-                alpha=0.7)
-    
-    title = f"Raw Detector Voltages{' - ' + title_suffix if title_suffix else ''}"
-    ax.set_title(title, fontsize=11)
-    ax.set_xlabel("Frequency (MHz)", fontsize=10)
-    ax.set_ylabel("Voltage (V)", fontsize=10)
-    ax.set_xlim(0, 350)
-    ax.set_ylim(0.8, 2.2)
-    ax.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    
-    # Convert to base64 PNG
-    buf = io.BytesIO()
-    try:
-        fig.savefig(buf, format='png', dpi=100, bbox_inches='tight')
-        buf.seek(0)
-        img_base64 = base64.b64encode(buf.read()).decode('utf-8')
-    finally:
-        buf.close()
-        plt.close(fig)
-    
-    return img_base64
+    with _render_lock:
+        # Reuse persistent figure
+        fig, ax = _get_figure('voltage')
+        _set_filter_points('voltage', frequencies, voltages, filter_indices, excluded_filters)
+        
+        title = f"Raw Detector Voltages{' - ' + title_suffix if title_suffix else ''}"
+        ax.title.set_text(title)
+        
+        # Convert to base64 PNG
+        return _figure_to_base64(fig)
 
 
 def create_power_plot_static(frequencies, powers, filter_indices,
@@ -90,51 +175,16 @@ def create_power_plot_static(frequencies, powers, filter_indices,
     if excluded_filters is None:
         excluded_filters = []
     
-    colors = get_filter_colors_mpl()
-    
-    # Organize data by filter
-    filter_data = {}
-    for freq, power, filt in zip(frequencies, powers, filter_indices):
-        if filt in excluded_filters:
-            continue
-        filt_num = int(filt) + 1  # 1-indexed
-        if filt_num not in filter_data:
-            filter_data[filt_num] = {'freq': [], 'values': []}
-        filter_data[filt_num]['freq'].append(freq)
-        filter_data[filt_num]['values'].append(power)
-    
-    # Create plot
-    fig, ax = plt.subplots(figsize=(8, 5), dpi=100)
-    
-    for filt_num in range(1, 22):
-        if filt_num not in filter_data:
-            continue
-        ax.plot(filter_data[filt_num]['freq'], 
-                filter_data[filt_num]['values'],
-                'o', markersize=2, color=colors[filt_num-1],
-                alpha=0.7)
-    
-    title = f"Calibrated Power Spectrum{' - ' + title_suffix if title_suffix else ''}"
-    ax.set_title(title, fontsize=11)
-    ax.set_xlabel("Frequency (MHz)", fontsize=10)
-    ax.set_ylabel("Power (dBm)", fontsize=10)
-    ax.set_xlim(-50, 350)
-    ax.set_ylim(-80, 20)
-    ax.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    
-    # Convert to base64 PNG
-    buf = io.BytesIO()
-    try:
-        fig.savefig(buf, format='png', dpi=100, bbox_inches='tight')
-        buf.seek(0)
-        img_base64 = base64.b64encode(buf.read()).decode('utf-8')
-    finally:
-        buf.close()
-        plt.close(fig)
-    
-    return img_base64
+    with _render_lock:
+        # Reuse persistent figure
+        fig, ax = _get_figure('power')
+        _set_filter_points('power', frequencies, powers, filter_indices, excluded_filters)
+        
+        title = f"Calibrated Power Spectrum{' - ' + title_suffix if title_suffix else ''}"
+        ax.title.set_text(title)
+        
+        # Convert to base64 PNG
+        return _figure_to_base64(fig)
 
 
 def create_filtercal_plot_static(lo_frequencies, voltages, title):
@@ -152,38 +202,22 @@ def create_filtercal_plot_static(lo_frequencies, voltages, title):
     
     Returns base64-encoded PNG image string.
     """
-    colors = get_filter_colors_mpl()
-    
-    # Create plot
-    fig, ax = plt.subplots(figsize=(8, 5), dpi=100)
-    
     # Downsample for speed
     step = 3
     lo_sub = lo_frequencies[::step]
-    volts_sub = voltages[::step, :]
-    
-    for filt_idx in range(21):
-        ax.plot(lo_sub, volts_sub[:, filt_idx],
-                linewidth=1, color=colors[filt_idx],
-                alpha=0.8)
-    
-    ax.set_title(title, fontsize=11)
-    ax.set_xlabel("LO Frequency (MHz)", fontsize=10)
-    ax.set_ylabel("Voltage (V)", fontsize=10)
-    ax.set_xlim(900, 960)
-    ax.set_ylim(0.8, 2.2)
-    ax.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    
-    # Convert to base64 PNG
-    buf = io.BytesIO()
-    try:
-        fig.savefig(buf, format='png', dpi=100, bbox_inches='tight')
-        buf.seek(0)
-        img_base64 = base64.b64encode(buf.read()).decode('utf-8')
-    finally:
-        buf.close()
-        plt.close(fig)
-    
-    return img_base64
+    volts_sub = voltages[::step, :21]
+    
+    with _render_lock:
+        # Reuse persistent figure
+        fig, ax = _get_figure('filtercal')
+        
+        # One LineCollection for all filters: segments[filt] = (lo, volts)
+        segments = np.stack(
+            np.broadcast_arrays(lo_sub[np.newaxis, :], volts_sub.T), axis=-1
+        )
+        _get_filtercal_lines().set_segments(segments)
+        
+        ax.title.set_text(title)
+        
+        # Convert to base64 PNG
+        return _figure_to_base64(fig)
@@ -7,7 +7,6 @@ Automatically displays the most recent spectrum as data is being collected.
 """
 
 import os
-import glob
 import argparse
 import time
 import json
@@ -16,10 +15,19 @@ import psutil
 from pathlib import Path
 from datetime import datetime
 import numpy as np
-from dash import Dash, dcc, html, Input, Output
+from dash import Dash, dcc, html, Input, Output, State, Patch, ctx, no_update
 import plotly.graph_objs as go
+import plotly.io as pio
 import traceback
 
+# orjson encodes the large float arrays in figures much faster than stdlib json
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = 'orjson'
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import utilities
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -40,9 +48,12 @@ DEFAULT_ALIGN_FREQ_MAX = 80  # MHz
 _calibration_cache = {}
 _last_cycle_dir = None
 
-# Filtercal figure JSON cache (filtercal data is static per cycle)
+# Filtercal figure JSON cache: (cycle_dir, filtercal mtimes) -> figures
 _filtercal_json_cache = {}
 
+# Cycle directory listing cache: data_dir -> (dir mtimes, date dirs, cycles newest first)
+_cycle_listing_cache = {}
+
 # Initialize Dash app
 app = Dash(__name__)
 app.title = "High-Z Filterbank Live Viewer"
@@ -167,44 +178,153 @@ app.layout = html.Div([
     dcc.Store(id='s21-dir-store', data=DEFAULT_S21_DIR),
     dcc.Store(id='align-freq-min-store', data=DEFAULT_ALIGN_FREQ_MIN),
     dcc.Store(id='align-freq-max-store', data=DEFAULT_ALIGN_FREQ_MAX),
+    # Layout signature of the plots currently shown (see plot_signature)
+    dcc.Store(id='plot-signature-store'),
+    # Spectrum currently shown: [state file, mtime_ns, size, spectrum index]
+    dcc.Store(id='shown-spectrum-store'),
 ])
 
-def find_most_recent_cycle(data_dir):
-    """Find the most recently modified cycle directory with valid data"""
+def count_table_rows(fits_file):
+    """
+    Return the number of rows in HDU 1 of a FITS file.
+    
+    Reads only the extension header (NAXIS2), so the table data is never
+    mapped or parsed.
+    """
     from astropy.io import fits
     
-    date_dirs = []
-    if os.path.exists(data_dir):
-        for entry in os.listdir(data_dir):
-            path = os.path.join(data_dir, entry)
-            if os.path.isdir(path) and len(entry) == 8 and entry.isdigit():
-                date_dirs.append(path)
+    return fits.getheader(fits_file, 1).get('NAXIS2', 0)
+
+
+def read_spectrum_counts(fits_file):
+    """
+    Return (table_rows, n_spectra) for a state file from a single open.
     
-    if not date_dirs:
-        return None
+    Only the primary and HDU 1 headers are parsed; N_SPECTRA falls back to
+    the table row count when the primary header does not record it.
+    """
+    from astropy.io import fits
+    
+    with fits.open(fits_file) as hdul:
+        n_rows = hdul[1].header.get('NAXIS2', 0)
+        return n_rows, hdul[0].header.get('N_SPECTRA', n_rows)
+
+
+def scan_dir(path, accept, want_dirs=False):
+    """
+    List (stat_result, path) for entries of `path` whose name passes `accept`.
+    
+    Uses a single os.scandir pass so the type check and stat come from the
+    directory entry rather than separate glob/isdir/getmtime calls.
+    """
+    found = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if not accept(entry.name):
+                    continue
+                if entry.is_dir() if want_dirs else entry.is_file():
+                    found.append((entry.stat(), entry.path))
+    except OSError:
+        pass
+    return found
+
+
+def find_state_files(cycle_dir):
+    """Return non-empty state_*.fits paths in a cycle, most recently modified first"""
+    state_files = [(st.st_mtime, path) for st, path in
+                   scan_dir(cycle_dir, lambda name: name.startswith("state_") and name.endswith(".fits"))
+                   if st.st_size > 0]
+    state_files.sort(reverse=True)
+    return [path for _, path in state_files]
+
+
+def cycle_sort_key(cycle_dir):
+    """
+    Chronological sort key for a Cycle_MMDDYYYY_NNN directory path.
+    
+    Names that do not follow the pattern sort before every timestamped cycle.
+    """
+    name = os.path.basename(cycle_dir)
+    parts = name.split("_")
+    if len(parts) == 3 and len(parts[1]) == 8 and parts[1].isdigit() and parts[2].isdigit():
+        date = parts[1]
+        return (date[4:] + date[:4], int(parts[2]), name)
+    return ("", -1, name)
+
+
+def filtercal_key(cycle_dir):
+    """Return [path, mtime_ns string or None] for each filtercal file of a cycle"""
+    key = []
+    for name in ("filtercal_+5dBm.fits", "filtercal_-4dBm.fits"):
+        path = os.path.join(cycle_dir, name)
+        try:
+            mtime = str(os.stat(path).st_mtime_ns)
+        except OSError:
+            mtime = None
+        key.append([path, mtime])
+    return key
+
+
+def list_cycle_dirs(data_dir):
+    """
+    Return all Cycle_* directories under data_dir, most recent first.
+    
+    Cycles are ordered by their timestamped names, so the order depends only
+    on which directories exist. Adding a date or cycle directory bumps the
+    mtime of its parent, so the listing is rescanned only when the mtime of
+    data_dir or of one of its date directories changes; idle refreshes cost
+    one stat per directory.
+    """
+    try:
+        data_mtime = os.stat(data_dir).st_mtime_ns
+    except OSError:
+        return []
+    
+    cached = _cycle_listing_cache.get(data_dir)
+    if cached is not None and cached[0][0] == data_mtime:
+        date_dirs = cached[1]
+    else:
+        date_dirs = [path for _, path in
+                     scan_dir(data_dir, lambda name: len(name) == 8 and name.isdigit(), want_dirs=True)]
+    
+    date_mtimes = []
+    for date_dir in date_dirs:
+        try:
+            date_mtimes.append(os.stat(date_dir).st_mtime_ns)
+        except OSError:
+            date_mtimes.append(None)
+    signature = (data_mtime, tuple(date_mtimes))
+    
+    if cached is not None and cached[0] == signature:
+        return cached[2]
     
     # Find all cycle directories across all dates
-    all_cycles = []
+    cycles = []
     for date_dir in date_dirs:
-        for entry in os.listdir(date_dir):
-            cycle_path = os.path.join(date_dir, entry)
-            if os.path.isdir(cycle_path) and entry.startswith("Cycle_"):
-                all_cycles.append(cycle_path)
+        cycles.extend(path for _, path in
+                      scan_dir(date_dir, lambda name: name.startswith("Cycle_"), want_dirs=True))
+    
+    # Sort by cycle timestamp (most recent first)
+    cycles.sort(key=cycle_sort_key, reverse=True)
+    
+    _cycle_listing_cache[data_dir] = (signature, date_dirs, cycles)
+    return cycles
+
+
+def find_most_recent_cycle(data_dir):
+    """Find the most recent cycle directory with valid data"""
+    all_cycles = list_cycle_dirs(data_dir)
     
     if not all_cycles:
         return None
     
-    # Sort by modification time (most recent first)
-    all_cycles.sort(key=os.path.getmtime, reverse=True)
-    
     # Return first cycle that has at least one state file with data
     for cycle in all_cycles:
-        state_files = glob.glob(os.path.join(cycle, "state_*.fits"))
-        for f in state_files:
+        for f in find_state_files(cycle):
             try:
-                with fits.open(f) as hdul:
-                    if hdul[1].data is not None and len(hdul[1].data) > 0:
-                        return cycle  # Found a cycle with valid data
+                if count_table_rows(f) > 0:
+                    return cycle  # Found a cycle with valid data
             except Exception:
                 continue
     
@@ -217,36 +337,65 @@ def find_latest_spectrum(cycle_dir):
     Find the most recent spectrum in the most recent state file.
     Returns (state_file_path, spectrum_index, total_spectra)
     """
-    from astropy.io import fits
-    
-    state_files = glob.glob(os.path.join(cycle_dir, "state_*.fits"))
-    
-    # Filter out files with no actual data (empty FITS tables)
-    valid_files = []
-    for f in state_files:
+    # Most recently modified state file that has rows (empty FITS tables are skipped);
+    # the row count and N_SPECTRA come from the same open
+    for f in find_state_files(cycle_dir):
         try:
-            with fits.open(f) as hdul:
-                if hdul[1].data is not None and len(hdul[1].data) > 0:
-                    valid_files.append(f)
-        except Exception:
+            n_rows, n_spectra = read_spectrum_counts(f)
+        except Exception as e:
+            print(f"Error reading state file {f}: {e}")
             continue
-    
-    if not valid_files:
-        return None, 0, 0
-    
-    # Get most recently modified state file with data
-    latest_state = max(valid_files, key=os.path.getmtime)
-    
-    # Check how many spectra are in it
-    try:
-        with fits.open(latest_state) as hdul:
-            n_spectra = hdul[0].header.get('N_SPECTRA', len(hdul[1].data))
         
-        # Return path to most recent spectrum (last one in file)
-        return latest_state, n_spectra - 1, n_spectra
-    except Exception as e:
-        print(f"Error reading state file {latest_state}: {e}")
-        return None, 0, 0
+        if n_rows > 0:
+            # Return path to most recent spectrum (last one in file)
+            return f, n_spectra - 1, n_spectra
+    
+    return None, 0, 0
+
+def find_graph_paths(component, path=()):
+    """
+    Map each dcc.Graph id inside a component tree to its location in the
+    serialized children (the key path a dash Patch on that prop would use).
+    """
+    paths = {}
+    if isinstance(component, dcc.Graph) and getattr(component, 'id', None):
+        paths[component.id] = list(path)
+    children = getattr(component, 'children', None)
+    if isinstance(children, (list, tuple)):
+        for i, child in enumerate(children):
+            paths.update(find_graph_paths(child, path + ('props', 'children', i)))
+    elif children is not None and hasattr(children, 'to_plotly_json'):
+        paths.update(find_graph_paths(children, path + ('props', 'children')))
+    return paths
+
+
+def plot_signature(plot_content, live_figures, view_mode, cycle_dir, has_filtercal):
+    """
+    Describe the plot layout: view mode, cycle and filtercal availability
+    (the filtercal figures only change with those), graph locations and trace
+    names. Refreshes with an unchanged signature only need new trace data.
+    """
+    graph_paths = find_graph_paths(plot_content)
+    return [view_mode, cycle_dir, has_filtercal,
+            [[graph_id, graph_paths.get(graph_id), [trace.name for trace in fig.data]]
+             for graph_id, fig in live_figures.items()]]
+
+
+def patch_live_figures(plot_content, live_figures):
+    """Build a Patch for plot-container children updating trace x/y and titles only"""
+    graph_paths = find_graph_paths(plot_content)
+    patch = Patch()
+    for graph_id, fig in live_figures.items():
+        node = patch
+        for key in graph_paths[graph_id]:
+            node = node[key]
+        figure = node['props']['figure']
+        for i, trace in enumerate(fig.data):
+            figure['data'][i]['x'] = trace.x
+            figure['data'][i]['y'] = trace.y
+        figure['layout']['title']['text'] = fig.layout.title.text
+    return patch
+
 
 @app.callback(
     Output('refresh-interval', 'interval'),
@@ -262,7 +411,9 @@ def update_refresh_interval(interval_seconds):
 @app.callback(
     [Output('plot-container', 'children'),
      Output('status-info', 'children'),
-     Output('last-update', 'children')],
+     Output('last-update', 'children'),
+     Output('plot-signature-store', 'data'),
+     Output('shown-spectrum-store', 'data')],
     [Input('refresh-interval', 'n_intervals'),
      Input('view-mode', 'value'),
      Input('filtercal-mode', 'value'),
@@ -271,11 +422,13 @@ def update_refresh_interval(interval_seconds):
      Input('data-dir-store', 'data'),
      Input('s21-dir-store', 'data'),
      Input('align-freq-min-store', 'data'),
-     Input('align-freq-max-store', 'data')]
+     Input('align-freq-max-store', 'data')],
+    [State('plot-signature-store', 'data'),
+     State('shown-spectrum-store', 'data')]
 )
 def update_live_view(n_intervals, view_mode, filtercal_mode, calib_toggles,
                      filter_exclusions_str, data_dir, s21_dir,
-                     align_freq_min, align_freq_max):
+                     align_freq_min, align_freq_max, shown_signature, shown_spectrum):
     """Auto-refresh and update plots with latest data"""
     
     callback_start = time.time()  # Track full callback time
@@ -304,7 +457,7 @@ def update_live_view(n_intervals, view_mode, filtercal_mode, calib_toggles,
         status = "⚠️ No data available"
         last_update = f"Last checked: {datetime.now().strftime('%H:%M:%S')}"
         print(f"\n*** CALLBACK TOTAL: {(time.time() - callback_start) * 1000:.1f}ms (no data) ***\n")
-        return html.Div([dcc.Graph(figure=empty_fig)]), status, last_update
+        return html.Div([dcc.Graph(figure=empty_fig)]), status, last_update, None, None
     
     # Find latest spectrum
     state_file, spectrum_idx, n_spectra = find_latest_spectrum(cycle_dir)
@@ -319,7 +472,22 @@ def update_live_view(n_intervals, view_mode, filtercal_mode, calib_toggles,
         status = f"📁 {os.path.basename(cycle_dir)}"
         last_update = f"Last checked: {datetime.now().strftime('%H:%M:%S')}"
         print(f"\n*** CALLBACK TOTAL: {(time.time() - callback_start) * 1000:.1f}ms (no spectrum) ***\n")
-        return html.Div([dcc.Graph(figure=empty_fig)]), status, last_update
+        return html.Div([dcc.Graph(figure=empty_fig)]), status, last_update, None, None
+    
+    # Timer refresh with the same spectrum and filtercal files unchanged: nothing to redraw
+    filtercal_files = filtercal_key(cycle_dir)
+    try:
+        state_stat = os.stat(state_file)
+        # mtime as a string: nanosecond integers exceed a browser's exact JSON ints
+        spectrum_key = [state_file, str(state_stat.st_mtime_ns), state_stat.st_size, int(spectrum_idx),
+                        filtercal_files]
+    except OSError:
+        spectrum_key = None
+    if (spectrum_key is not None and spectrum_key == shown_spectrum
+            and ctx.triggered_id == 'refresh-interval'):
+        last_update = f"Last checked: {datetime.now().strftime('%H:%M:%S')} (no new data)"
+        print(f"\n*** CALLBACK TOTAL: {(time.time() - callback_start) * 1000:.1f}ms (unchanged) ***\n")
+        return no_update, no_update, last_update, no_update, no_update
     
     try:
         prepared = load_prepared_spectrum_data(
@@ -365,6 +533,7 @@ def update_live_view(n_intervals, view_mode, filtercal_mode, calib_toggles,
                 dcc.Graph(id='main-power-graph', figure=power_fig, 
                          style={'height': '700px'}, config=plot_config)
             ])
+            live_figures = {'main-power-graph': power_fig}
             t5 = time.time()
             
             # Measure figure size
@@ -405,8 +574,9 @@ def update_live_view(n_intervals, view_mode, filtercal_mode, calib_toggles,
             
             # Create filtercal plots if available
             # OPTIMIZATION: Filtercal data is static per cycle, so cache the Figure objects
+            # (keyed by the filtercal mtimes too, so a rewritten filtercal is redrawn)
             global _filtercal_json_cache
-            cache_key = cycle_dir
+            cache_key = (cycle_dir, tuple(mtime for _, mtime in filtercal_files))
             
             t_filtercal_start = time.time()
             if filtercal_data and 'pos' in filtercal_data and 'neg' in filtercal_data:
@@ -427,8 +597,8 @@ def update_live_view(n_intervals, view_mode, filtercal_mode, calib_toggles,
                     time_neg = filtercal_neg.get('timestamp', '')
                     
                     # Convert ADC to voltage
-                    volts_pos = adc_counts_to_voltage(filtercal_pos['data'], ref=5.0)
-                    volts_neg = adc_counts_to_voltage(filtercal_neg['data'], ref=5.0)
+                    volts_pos = adc_counts_to_voltage(filtercal_pos['data'], ref=5.0, dtype=np.float32)
+                    volts_neg = adc_counts_to_voltage(filtercal_neg['data'], ref=5.0, dtype=np.float32)
                     
                     lo_pos = filtercal_pos['lo_frequencies']
                     lo_neg = filtercal_neg['lo_frequencies']
@@ -565,6 +735,7 @@ def update_live_view(n_intervals, view_mode, filtercal_mode, calib_toggles,
                     ], style={'display': 'inline-block', 'width': '48%', 'verticalAlign': 'top'}),
                 ])
             ])
+            live_figures = {'grid-voltage-graph': voltage_fig, 'grid-power-graph': power_fig}
             
             # Measure JSON size after downsampling
             t_json_start = time.time()
@@ -590,11 +761,18 @@ def update_live_view(n_intervals, view_mode, filtercal_mode, calib_toggles,
         mem_end = process.memory_info().rss / 1024 / 1024
         print(f"Memory at end: {mem_end:.1f} MB (delta: {mem_end - mem_start:+.1f} MB)")
         
+        # Same graphs as last refresh: send only the changed trace data and titles
+        signature = plot_signature(plot_content, live_figures, view_mode, cycle_dir,
+                                   bool(filtercal_data))
+        if signature == shown_signature:
+            plot_content = patch_live_figures(plot_content, live_figures)
+            print("  Sending Patch (layout unchanged)")
+        
         # Log total callback time
         callback_total = (time.time() - callback_start) * 1000
         print(f"\n*** CALLBACK TOTAL: {callback_total:.1f}ms ***\n")
         
-        return plot_content, status, last_update
+        return plot_content, status, last_update, signature, spectrum_key
         
     except Exception as e:
         print(f"ERROR in callback: {e}")
@@ -609,7 +787,7 @@ def update_live_view(n_intervals, view_mode, filtercal_mode, calib_toggles,
         last_update = f"Last checked: {datetime.now().strftime('%H:%M:%S')}"
         gc.collect()
         print(f"\n*** CALLBACK TOTAL: {(time.time() - callback_start) * 1000:.1f}ms (error) ***\n")
-        return html.Div([dcc.Graph(figure=empty_fig)]), status, last_update
+        return html.Div([dcc.Graph(figure=empty_fig)]), status, last_update, None, None
 
 
 if __name__ == '__main__':
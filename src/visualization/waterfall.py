@@ -26,6 +26,7 @@ from matplotlib.widgets import RectangleSelector
 from datetime import datetime
 import json
 from typing import List, Tuple, Optional
+from functools import lru_cache
 import sys
 
 # Add parent paths to import calibration utilities
@@ -33,6 +34,10 @@ root_dir = Path(__file__).parent.parent.parent  # src/filterbank/visualization -
 highz_filterbank_root = root_dir.parent.parent  # src -> Highz-EXP
 sys.path.insert(0, str(root_dir))
 sys.path.insert(0, str(highz_filterbank_root / "highz-filterbank" / "tools" / "rtviewer"))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # src, for utilities
+
+from utilities.io_utils import (FILTER_CENTERS_MHZ, calibration_arrays,
+                                adc_counts_to_voltage, adc_counts_to_power)
 
 try:
     import calibration_utils as cal
@@ -101,27 +106,20 @@ def load_s21_corrections(s21_dir: Path = None) -> dict:
 
 
 def makeSingleListOfInts(a1, a2, a3):
-    """Convert three ADC arrays to single list of integers."""
-    ADC1, ADC2, ADC3 = list(), list(), list()
-    for i in range(len(a1)):
-        ADC1.append(int(a1[i]))
-        ADC2.append(int(a2[i]))
-        ADC3.append(int(a3[i]))
-    return ADC1 + ADC2 + ADC3
+    """Convert three ADC arrays to a single int64 array (ADC1, ADC2, ADC3)."""
+    return np.concatenate((np.asarray(a1, dtype=np.int64),
+                           np.asarray(a2, dtype=np.int64),
+                           np.asarray(a3, dtype=np.int64)))
 
 
-def toVolts(data):
-    """Convert ADC counts to voltage."""
-    adjustedData = []
-    REF = 5.0
-    for i in data:
-        if (i >> 31) == 1:
-            divisor = 2**31
-            adjustedData.append(REF * 2 - i/divisor * REF)
-        else:
-            divisor = 2**31 - 1
-            adjustedData.append(i/divisor * REF)
-    return adjustedData
+# ADC code -> volts mapping of the state files (REF = 5.0 V, c_like). DATA_CUBE is
+# unsigned 32-bit ('3024V', continuous_acq.c) or int64 ('6321K', filterSweep.c)
+ADC_MAPPING = dict(ref=5.0, denom_pos=2**31 - 1, denom_neg=2**31)
+
+
+# Fallback detector fit (dBm = slope * V + intercept) for uncalibrated filters
+FALLBACK_SLOPE = -43.5
+FALLBACK_INTERCEPT = 24.98
 
 
 def check_spectrum_quality(rf_freqs: np.ndarray, powers: np.ndarray) -> bool:
@@ -158,6 +156,103 @@ def check_spectrum_quality(rf_freqs: np.ndarray, powers: np.ndarray) -> bool:
     return not is_suspect  # Return True for good, False for suspect
 
 
+@lru_cache(maxsize=32)
+def _filter_calibration_from_files(high_file: str, high_mtime_ns: int,
+                                   low_file: str, low_mtime_ns: int) -> dict:
+    """
+    Build the per-filter calibration from a high/low power filtercal pair.
+    
+    Cached on the path and modification time of both files, so every state
+    file of a cycle (and repeated plots in one session) reuse one parse.
+    Callers must not mutate the returned dict.
+    """
+    filter_cal = {}
+    
+    # Actual power levels at LO output
+    low_power_dbm = -9.0
+    high_power_dbm = 0.0
+
+    # Load S21 corrections if enabled
+    s21_corrections = None
+    if APPLY_S21_CORRECTIONS:
+        s21_corrections = load_s21_corrections()
+
+    # Load calibration data
+    with fits.open(low_file) as hdul:
+        low_data = hdul[1].data
+        n_lo_pts_low = hdul[0].header.get('N_LO_PTS', 301)
+
+    with fits.open(high_file) as hdul:
+        high_data = hdul[1].data
+        n_lo_pts_high = hdul[0].header.get('N_LO_PTS', 301)
+
+    # Reconstruct LO frequencies for filter calibrations
+    # Filter cals sweep 900-960 MHz in 0.2 MHz steps (301 points)
+    lo_frequencies = get_lo_frequencies(n_lo_pts_low)
+
+    # Convert DATA_CUBE to voltages at each LO frequency
+    # Low power calibration
+    low_data_cube = low_data[0]['DATA_CUBE']
+    low_cube_2d = low_data_cube.reshape(21, n_lo_pts_low)
+
+    # High power calibration
+    high_data_cube = high_data[0]['DATA_CUBE']
+    high_cube_2d = high_data_cube.reshape(21, n_lo_pts_high)
+
+    # For each filter, find LO frequency closest to filter center
+    filter_idx = np.arange(21)
+    lo_diffs = np.abs(lo_frequencies[np.newaxis, :] - FILTER_CENTERS_MHZ[:, np.newaxis])
+    closest_lo_idx = np.argmin(lo_diffs, axis=1)
+    # Only use if within 1 MHz
+    in_range = lo_diffs[filter_idx, closest_lo_idx] <= 1.0
+
+    # ADC count of each filter at its own center LO (diagonal of the cube),
+    # converted to voltage in one call per power level
+    low_adc = low_cube_2d[filter_idx, closest_lo_idx]
+    high_adc = high_cube_2d[filter_idx, closest_lo_idx]
+    if CAL_AVAILABLE and cal:
+        low_volts = np.asarray(cal.toVolts(low_adc.astype(int).tolist()))
+        high_volts = np.asarray(cal.toVolts(high_adc.astype(int).tolist()))
+    else:
+        low_volts = adc_counts_to_voltage(low_adc, **ADC_MAPPING)
+        high_volts = adc_counts_to_voltage(high_adc, **ADC_MAPPING)
+
+    for filt_num in filter_idx[in_range]:
+        filt_num = int(filt_num)
+        center_freq = FILTER_CENTERS_MHZ[filt_num]
+        low_voltage = low_volts[filt_num]
+        high_voltage = high_volts[filt_num]
+
+        # Apply S21 correction if available
+        s21_loss_db = 0.0
+        if s21_corrections and filt_num in s21_corrections:
+            s21_freqs = s21_corrections[filt_num]['freqs']
+            s21_db = s21_corrections[filt_num]['s21_db']
+            s21_loss_db = np.interp(center_freq, s21_freqs, s21_db)
+
+        # Adjust power levels for S21 loss
+        low_power_at_detector = low_power_dbm + s21_loss_db
+        high_power_at_detector = high_power_dbm + s21_loss_db
+
+        # Calculate calibration curve
+        voltage_diff = high_voltage - low_voltage
+        if abs(voltage_diff) < 0.001:
+            continue
+
+        slope = (high_power_at_detector - low_power_at_detector) / voltage_diff
+        intercept = low_power_at_detector - slope * low_voltage
+
+        filter_cal[filt_num] = {
+            'slope': slope,
+            'intercept': intercept,
+            'low_v': low_voltage,
+            'high_v': high_voltage,
+            's21_db': s21_loss_db
+        }
+    
+    return filter_cal
+
+
 def load_filter_calibration(cycle_dir: Path = None, calib_dir: Path = None, verbose: bool = False) -> dict:
     """
     Load filter calibration data from 0dBm and -9dBm calibration files.
@@ -203,95 +298,9 @@ def load_filter_calibration(cycle_dir: Path = None, calib_dir: Path = None, verb
         if verbose:
             print(f"Loading calibration: {high_file.name}, {low_file.name}")
         
-        # Actual power levels at LO output
-        low_power_dbm = -9.0
-        high_power_dbm = 0.0
-        
-        # Load S21 corrections if enabled
-        s21_corrections = None
-        if APPLY_S21_CORRECTIONS:
-            s21_corrections = load_s21_corrections()
-            if s21_corrections and verbose:
-                print(f"Loaded S21 corrections for {len(s21_corrections)} filters")
-        
-        # Filter center frequencies
-        filter_centers = [904.0 + i * 2.6 for i in range(21)]
-        
-        # Load calibration data
-        with fits.open(low_file) as hdul:
-            low_data = hdul[1].data
-            n_lo_pts_low = hdul[0].header.get('N_LO_PTS', 301)
-        
-        with fits.open(high_file) as hdul:
-            high_data = hdul[1].data
-            n_lo_pts_high = hdul[0].header.get('N_LO_PTS', 301)
-        
-        # Reconstruct LO frequencies for filter calibrations
-        # Filter cals sweep 900-960 MHz in 0.2 MHz steps (301 points)
-        lo_frequencies = get_lo_frequencies(n_lo_pts_low)
-        
-        # Convert DATA_CUBE to voltages at each LO frequency
-        # Low power calibration
-        low_data_cube = low_data[0]['DATA_CUBE']
-        low_cube_2d = low_data_cube.reshape(21, n_lo_pts_low)
-        
-        # High power calibration
-        high_data_cube = high_data[0]['DATA_CUBE']
-        high_cube_2d = high_data_cube.reshape(21, n_lo_pts_high)
-        
-        # For each filter, find LO frequency closest to filter center
-        for filt_num in range(21):
-            center_freq = filter_centers[filt_num]
-            
-            # Find LO frequency closest to this filter's center
-            lo_diffs = np.abs(lo_frequencies - center_freq)
-            closest_lo_idx = np.argmin(lo_diffs)
-            
-            # Only use if within 1 MHz
-            if lo_diffs[closest_lo_idx] > 1.0:
-                continue
-            
-            # Get ADC counts at this LO for all filters, then convert to voltage
-            low_adc = low_cube_2d[:, closest_lo_idx]
-            if CAL_AVAILABLE and cal:
-                low_volts = cal.toVolts(low_adc.astype(int).tolist())
-            else:
-                low_volts = toVolts(low_adc.astype(int).tolist())
-            low_voltage = low_volts[filt_num]
-            
-            high_adc = high_cube_2d[:, closest_lo_idx]
-            if CAL_AVAILABLE and cal:
-                high_volts = cal.toVolts(high_adc.astype(int).tolist())
-            else:
-                high_volts = toVolts(high_adc.astype(int).tolist())
-            high_voltage = high_volts[filt_num]
-            
-            # Apply S21 correction if available
-            s21_loss_db = 0.0
-            if s21_corrections and filt_num in s21_corrections:
-                s21_freqs = s21_corrections[filt_num]['freqs']
-                s21_db = s21_corrections[filt_num]['s21_db']
-                s21_loss_db = np.interp(center_freq, s21_freqs, s21_db)
-            
-            # Adjust power levels for S21 loss
-            low_power_at_detector = low_power_dbm + s21_loss_db
-            high_power_at_detector = high_power_dbm + s21_loss_db
-            
-            # Calculate calibration curve
-            voltage_diff = high_voltage - low_voltage
-            if abs(voltage_diff) < 0.001:
-                continue
-            
-            slope = (high_power_at_detector - low_power_at_detector) / voltage_diff
-            intercept = low_power_at_detector - slope * low_voltage
-            
-            filter_cal[filt_num] = {
-                'slope': slope,
-                'intercept': intercept,
-                'low_v': low_voltage,
-                'high_v': high_voltage,
-                's21_db': s21_loss_db
-            }
+        filter_cal = dict(_filter_calibration_from_files(
+            str(high_file), high_file.stat().st_mtime_ns,
+            str(low_file), low_file.stat().st_mtime_ns))
         
         if verbose:
             print(f"Loaded calibration for {len(filter_cal)} filters")
@@ -420,6 +429,8 @@ def calculate_rf_frequencies(lo_freq: float, n_filters: int = 21) -> np.ndarray:
     Returns:
         Array of RF frequencies for each filter
     """
+    if n_filters == len(FILTER_CENTERS_MHZ):
+        return FILTER_CENTERS_MHZ - lo_freq
     filter_indices = np.arange(n_filters)
     return (2.6 * filter_indices + 904) - lo_freq
 
@@ -614,6 +625,13 @@ def load_state_file(fits_path: Path,
         # Reconstruct LO frequencies
         lo_frequencies = get_lo_frequencies(n_lo_pts)
         
+        # Read the columns once for all spectra instead of row by row
+        timestamps = data['SPECTRUM_TIMESTAMP']
+        data_cubes = np.asarray(data['DATA_CUBE']).reshape(len(data), n_filters, n_lo_pts)
+        # Actual LO frequencies if recorded (handles circular bug)
+        lo_freq_rows = (np.asarray(data['LO_FREQUENCIES'])
+                        if 'LO_FREQUENCIES' in data.dtype.names else None)
+        
         # Initialize waterfall data container
         waterfall = WaterfallData(state)
         
@@ -705,86 +723,34 @@ def load_state_file(fits_path: Path,
         elif verbose:
             print(f"  Skipping quality checks (state 1)...")
         
+        # Convert every spectrum at once: (n_spectra, n_filters, n_lo_pts) cubes
+        slopes, intercepts = calibration_arrays(filter_cal, n_filters,
+                                                FALLBACK_SLOPE, FALLBACK_INTERCEPT)
+        if CAL_AVAILABLE and cal:
+            volts_cube = np.asarray(cal.toVolts(data_cubes.ravel().astype(int).tolist())).reshape(data_cubes.shape)
+            powers_cube = slopes[:, np.newaxis] * volts_cube + intercepts[:, np.newaxis]
+        else:
+            powers_cube = adc_counts_to_power(data_cubes, slopes, intercepts,
+                                              axis=1, **ADC_MAPPING)
+        
+        # Multi-filter mode: RF frequency of every (LO, filter) point, LO-major
+        n_lo = min(len(lo_frequencies), n_lo_pts)
+        multi_rf_freqs = (FILTER_CENTERS_MHZ[np.newaxis, :n_filters]
+                          - lo_frequencies[:n_lo, np.newaxis]).ravel()
+        
         # Process each spectrum
-        for spectrum_idx, row in enumerate(data):
-            timestamp = row['SPECTRUM_TIMESTAMP']
-            data_cube = row['DATA_CUBE']
-            
-            # Get actual LO frequencies if available (handles circular bug)
-            if 'LO_FREQUENCIES' in data.dtype.names:
-                actual_lo_freqs = row['LO_FREQUENCIES']
-            else:
-                # Fallback: use reconstructed LO frequencies
-                actual_lo_freqs = lo_frequencies
-            
-            # Reshape data cube to (n_filters, n_lo_pts)
-            cube_2d = data_cube.reshape(n_filters, n_lo_pts)
-            
+        for spectrum_idx, powers_2d in enumerate(powers_cube):
             # For single filter mode: use actual LO frequencies to calculate RF
             # For multi-filter mode: calculate RF frequencies for all filters
             if filter_num is not None:
+                # Fallback: use reconstructed LO frequencies
+                actual_lo_freqs = lo_freq_rows[spectrum_idx] if lo_freq_rows is not None else lo_frequencies
                 # Single filter: store power and actual RF frequencies
-                all_powers = []
-                all_rf_freqs = []
-                
-                filter_center = 904 + 2.6 * filter_num
-                
-                for lo_idx in range(n_lo_pts):
-                    adc_count = cube_2d[filter_num, lo_idx]
-                    lo_freq = actual_lo_freqs[lo_idx]
-                    
-                    # Convert to voltage
-                    if CAL_AVAILABLE and cal:
-                        voltage = cal.toVolts([int(adc_count)])[0]
-                    else:
-                        voltage = toVolts([int(adc_count)])[0]
-                    
-                    # Convert to power
-                    if filter_cal and filter_num in filter_cal:
-                        slope = filter_cal[filter_num]['slope']
-                        intercept = filter_cal[filter_num]['intercept']
-                        power = slope * voltage + intercept
-                    else:
-                        power = -43.5 * voltage + 24.98
-                    
-                    # Calculate actual RF frequency from actual LO
-                    rf_freq = filter_center - lo_freq
-                    
-                    all_powers.append(power)
-                    all_rf_freqs.append(rf_freq)
-                
-                all_rf_freqs = np.array(all_rf_freqs)
-                all_powers = np.array(all_powers)
-                all_filter_nums = np.full(n_lo_pts, filter_num)
+                all_powers = powers_2d[filter_num, :]
+                all_rf_freqs = FILTER_CENTERS_MHZ[filter_num] - np.asarray(actual_lo_freqs)[:n_lo_pts]
             else:
-                # Multi-filter mode: calculate RF frequencies for all filters
-                all_rf_freqs = []
-                all_powers = []
-                all_filter_nums = []
-                
-                for lo_idx, lo_freq in enumerate(lo_frequencies):
-                    adc_counts_at_lo = cube_2d[:, lo_idx]
-                    
-                    if CAL_AVAILABLE and cal:
-                        volts_at_lo = cal.toVolts(adc_counts_at_lo.astype(int).tolist())
-                    else:
-                        volts_at_lo = toVolts(adc_counts_at_lo.astype(int).tolist())
-                    
-                    for filt_num in range(n_filters):
-                        voltage = volts_at_lo[filt_num]
-                        
-                        if filter_cal and filt_num in filter_cal:
-                            slope = filter_cal[filt_num]['slope']
-                            intercept = filter_cal[filt_num]['intercept']
-                            power = slope * voltage + intercept
-                        else:
-                            power = -43.5 * voltage + 24.98
-                        
-                        rf_freq = (2.6 * filt_num + 904) - lo_freq
-                        
-                        all_rf_freqs.append(rf_freq)
-                        all_powers.append(power)
-                        all_filter_nums.append(filt_num)
+                all_powers = powers_2d[:, :n_lo].T.ravel()
+                all_rf_freqs = multi_rf_freqs
             
             # Store for quality checking
             all_spectra_rf.append(np.array(all_rf_freqs))
@@ -805,30 +771,25 @@ def load_state_file(fits_path: Path,
             # Skip position-excluded spectra
             if spectrum_idx in position_excluded:
                 if verbose:
-                    print(f"  Excluding spectrum {spectrum_idx} ({data[spectrum_idx]['SPECTRUM_TIMESTAMP']}) - position-based cutoff")
+                    print(f"  Excluding spectrum {spectrum_idx} ({timestamps[spectrum_idx]}) - position-based cutoff")
                 continue
             
             # Skip quality-excluded spectra
             if spectrum_idx in quality_excluded:
                 if verbose:
-                    print(f"  Excluding spectrum {spectrum_idx} ({data[spectrum_idx]['SPECTRUM_TIMESTAMP']}) - quality check failed")
+                    print(f"  Excluding spectrum {spectrum_idx} ({timestamps[spectrum_idx]}) - quality check failed")
                 continue
             
             # Get filter numbers for this spectrum
             if filter_num is not None:
                 all_filter_nums = np.full(len(all_rf_freqs), filter_num)
             else:
-                # Multi-filter mode needs filter nums reconstruction
-                all_filter_nums = []
-                n_lo = len([x for x in all_spectra_power[spectrum_idx] if x is not None]) // n_filters if n_filters > 0 else 1
-                for _ in range(n_lo):
-                    for filt_num in range(n_filters):
-                        all_filter_nums.append(filt_num)
-                all_filter_nums = np.array(all_filter_nums)
+                # Multi-filter mode: points are LO-major, filters 0..n_filters-1 per LO
+                all_filter_nums = np.tile(np.arange(n_filters), n_lo)
             
             # Add spectrum to waterfall
             waterfall.add_spectrum(
-                data[spectrum_idx]['SPECTRUM_TIMESTAMP'],
+                timestamps[spectrum_idx],
                 all_rf_freqs,
                 all_powers,
                 all_filter_nums
@@ -1064,7 +1025,8 @@ def plot_waterfall(waterfall: WaterfallData,
     
     # Plot waterfall
     # With origin='upper', extent should be [xmin, xmax, ymax, ymin] for top-to-bottom
-    extent = [freq_centers.min(), freq_centers.max(), 
+    # freq_centers is an increasing grid by construction, so its ends are the bounds
+    extent = [freq_centers[0], freq_centers[-1], 
               time_values.max(), time_values.min()]
     
     im = ax.imshow(power_grid, 
@@ -1120,7 +1082,7 @@ def plot_waterfall(waterfall: WaterfallData,
             if event.key == 'h':  # Home/reset
                 ax.set_xlim(ax._orig_xlim)
                 ax.set_ylim(ax._orig_ylim)
-                fig.canvas.draw()
+                fig.canvas.draw_idle()
         
         fig.canvas.mpl_connect('key_press_event', on_key)
     